@@ -1,20 +1,36 @@
 from langchain_anthropic import ChatAnthropic
 from langchain_core.messages import SystemMessage, HumanMessage
+import copy
 import json
 import os
 import logging
+import time
 from typing import Dict, List, Optional
 from enum import Enum
 from dataclasses import dataclass
 from datetime import datetime
 from .prompts import (
+    BATCH_VALIDATOR_CHECK_PROMPT,
     PLAYER_SYSTEM_PROMPT,
     PLAYER_TURN_PROMPT,
     PERSON_INFO_PROMPT,
     VALIDATOR_CHECK_PROMPT,
     VALIDATOR_SYSTEM_PROMPT
 )
+from .batching import shared_batcher
+from .cache import normalize_person, person_info_cache, verdict_cache, verdict_key
+from .event_log import (
+    CATEGORY_BANNED,
+    MOVE_PROPOSED,
+    MOVE_VALIDATED,
+    PLAYER_ELIMINATED,
+    TURN_ADVANCED,
+    GameRecorder
+)
 from .game_state import GameState, Move, Player
+from .prompt_budget import PromptBudgetController
+from .routing import DEFAULT_STRONG_MODEL, ModelRoutingPolicy, RoutingDecision, RoutingLog
+from .speculation import TurnSpeculator, turn_fingerprint
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -98,7 +114,18 @@ class LLMClientFactory:
                     helicone_key, role, player_id
                 )
             
-            # Development: Direct Anthropic API
+            # Development: Direct Anthropic API, or a stand-in server such as the load-test fake
+            base_url = os.environ.get("ANTHROPIC_BASE_URL")
+            if base_url:
+                logger.info(f"Development mode: Using Anthropic-compatible API at {base_url}")
+                return ChatAnthropic(
+                    model=model_name,
+                    anthropic_api_key=anthropic_api_key,
+                    anthropic_api_url=base_url,
+                    temperature=temperature,
+                    max_tokens=max_tokens
+                )
+            
             logger.info("Development mode: Using direct Anthropic API")
             return ChatAnthropic(
                 model=model_name,
@@ -178,7 +205,7 @@ class JSONResponseParser:
 class JockeyAgent:
     """AI agent that plays the No More Jockeys game."""
     
-    def __init__(self, player_id: int, model_name: str = "claude-3-5-sonnet-20241022"):
+    def __init__(self, player_id: int, model_name: str = DEFAULT_STRONG_MODEL, prompt_budget: PromptBudgetController = None):
         """Initialize the jockey agent with LLM client and system prompt."""
         logger.info(f"Initializing JockeyAgent for player {player_id}")
         
@@ -192,18 +219,17 @@ class JockeyAgent:
                 player_id=player_id
             )
             self.system_prompt = PLAYER_SYSTEM_PROMPT.format(player_id=player_id)
+            self.prompt_budget = prompt_budget or PromptBudgetController.from_env()
             logger.info(f"Successfully initialized JockeyAgent for player {player_id}")
         except Exception as e:
             logger.error(f"Failed to initialize JockeyAgent for player {player_id}: {str(e)}")
             raise
     
-    def take_turn(self, game_state: GameState, feedback: str = None) -> dict:
-        """Generate a move based on current game state.
-        Optionally include feedback from a previous invalid attempt."""
-        banned_cats = "\n".join([
-            f"- {b['category']} (banned when {b['banned_by']} was named)"
-            for b in game_state.banned_categories
-        ]) if game_state.banned_categories else "None yet"
+    def build_turn_prompt(self, game_state: GameState, feedback: str = None) -> str:
+        """Render the turn prompt for the current game state."""
+        banned_cats = self.prompt_budget.render_player_categories(
+            game_state.banned_categories
+        ) if game_state.banned_categories else "None yet"
         
         recent_moves = "\n".join([
             f"Player {m.player_id}: {m.person} - no more {m.category}"
@@ -217,12 +243,17 @@ class JockeyAgent:
         # Add feedback if this is a retry attempt
         feedback_text = f"\n\nPREVIOUS ATTEMPT FEEDBACK: {feedback}\nPlease choose a different person who does NOT fall into the banned categories." if feedback else ""
         
-        turn_prompt = PLAYER_TURN_PROMPT.format(
+        return PLAYER_TURN_PROMPT.format(
             banned_categories=banned_cats,
             recent_moves=recent_moves,
             active_players=active_players,
             eliminated_players=eliminated or "None"
         ) + feedback_text
+    
+    def take_turn(self, game_state: GameState, feedback: str = None) -> dict:
+        """Generate a move based on current game state.
+        Optionally include feedback from a previous invalid attempt."""
+        turn_prompt = self.build_turn_prompt(game_state, feedback)
         
         messages = [
             SystemMessage(content=self.system_prompt),
@@ -251,80 +282,293 @@ class JockeyAgent:
 class ValidatorAgent:
     """AI agent that validates moves and provides person information."""
     
-    def __init__(self, model_name: str = "claude-3-5-sonnet-20241022"):
-        """Initialize the validator agent with LLM client."""
+    def __init__(self, model_name: str = None, routing_policy: ModelRoutingPolicy = None,
+                 prompt_budget: PromptBudgetController = None):
+        """Initialize the validator agent with LLM clients.
+        
+        Args:
+            model_name: Use this single model for every call (disables the cascade)
+            routing_policy: Model routing policy; defaults to NMJ_* environment settings
+            prompt_budget: Controls how banned categories are rendered into prompts
+        """
         logger.info("Initializing ValidatorAgent")
         
         try:
-            self.llm = LLMClientFactory.create_anthropic_client(
-                model_name=model_name,
-                temperature=0.1,  # Low temperature for consistency
-                max_tokens=300,
-                role="validator"
-            )
+            if model_name:
+                routing_policy = ModelRoutingPolicy.single_model(model_name)
+            self.routing_policy = routing_policy or ModelRoutingPolicy.from_env()
+            self.routing_log = RoutingLog()
+            self.prompt_budget = prompt_budget or PromptBudgetController.from_env()
+            self._batch_llms: dict[tuple[str, int], ChatAnthropic] = {}
+            
+            self.llm = self._create_client(self.routing_policy.strong_model)
+            if self.routing_policy.cascade_enabled and self.routing_policy.fast_model != self.routing_policy.strong_model:
+                self.fast_llm = self._create_client(self.routing_policy.fast_model)
+            else:
+                self.fast_llm = self.llm
             logger.info("Successfully initialized ValidatorAgent")
         except Exception as e:
             logger.error(f"Failed to initialize ValidatorAgent: {str(e)}")
             raise
     
+    @staticmethod
+    def _create_client(model_name: str) -> ChatAnthropic:
+        return LLMClientFactory.create_anthropic_client(
+            model_name=model_name,
+            temperature=0.1,  # Low temperature for consistency
+            max_tokens=300,
+            role="validator"
+        )
+    
     def get_person_info(self, person: str) -> dict:
         """Get comprehensive info about a person"""
+        cached = person_info_cache.get(normalize_person(person))
+        if cached is not None:
+            return cached
+        
         messages = [
             SystemMessage(content="You are a factual information provider."),
             HumanMessage(content=PERSON_INFO_PROMPT.format(person=person))
         ]
         
-        response = self.llm.invoke(messages)
+        started = time.perf_counter()
+        response = self.fast_llm.invoke(messages)
+        self.routing_log.record(RoutingDecision(
+            stage="person_info",
+            person=person,
+            model=self.routing_policy.person_info_model,
+            confidence=None,
+            escalated=False,
+            reason=None,
+            latency_seconds=time.perf_counter() - started
+        ))
         try:
-            return JSONResponseParser.parse_json_response(response.content)
+            person_info = JSONResponseParser.parse_json_response(response.content)
         except Exception as e:
             print(f"Error parsing person info: {e}")
             print(f"Person info response content was: '{response.content}'")
             return {"error": f"Could not parse person info: {str(e)}"}
+        
+        person_info_cache.put(normalize_person(person), person_info)
+        return person_info
+    
+    def build_check_prompt(self, person: str, person_info: dict, banned_categories: list[dict]) -> str:
+        """Render the validation prompt for one person."""
+        return VALIDATOR_CHECK_PROMPT.format(
+            person=person,
+            person_info=json.dumps(person_info),
+            banned_categories=self.prompt_budget.render_validator_categories(banned_categories)
+        )
     
     def validate_move(self, person: str, banned_categories: list[dict]) -> tuple[bool, list[str], dict]:
         """Check if person violates any banned categories"""
         if not banned_categories:
             return True, [], {}
         
+        key = verdict_key(person, banned_categories)
+        cached = verdict_cache.get(key)
+        if cached is not None:
+            return cached
+        
         # First get person info
         person_info = self.get_person_info(person)
-        
-        banned_cats = "\n".join([
-            f"- {b['category']}" for b in banned_categories
-        ])
-        
-        check_prompt = VALIDATOR_CHECK_PROMPT.format(
-            person=person,
-            person_info=json.dumps(person_info),
-            banned_categories=banned_cats
-        )
+        check_prompt = self.build_check_prompt(person, person_info, banned_categories)
         
         messages = [
             SystemMessage(content=VALIDATOR_SYSTEM_PROMPT),
             HumanMessage(content=check_prompt)
         ]
         
-        response = self.llm.invoke(messages)
+        result = None
+        if self.routing_policy.cascade_enabled:
+            # First pass on the fast model; keep its verdict unless it is uncertain or disputed
+            result = self._run_check(self.fast_llm, messages, person, self.routing_policy.fast_model)
+            reason = self.routing_policy.escalation_reason(result)
+            if reason:
+                logger.info(f"Escalating validation of {person} to {self.routing_policy.strong_model}: {reason}")
+                result = self._run_check(self.llm, messages, person, self.routing_policy.strong_model, reason)
+        else:
+            result = self._run_check(self.llm, messages, person, self.routing_policy.strong_model)
+        
+        if result is None or "safe" not in result:
+            # If parsing fails, assume valid to keep game flowing
+            return True, [], {"error": "Validation parsing failed"}
+        
+        verdict = (result["safe"], result.get("violations", []), result.get("explanations", {}))
+        verdict_cache.put(key, verdict)
+        return verdict
+    
+    def _run_check(self, llm: ChatAnthropic, messages: list, person: str, model: str, escalation_reason: str = None) -> Optional[dict]:
+        """Run one validation call and record how it was routed; None if unparseable."""
+        started = time.perf_counter()
+        response = llm.invoke(messages)
+        latency = time.perf_counter() - started
         
         try:
             result = JSONResponseParser.parse_json_response(response.content)
-            return result["safe"], result.get("violations", []), result.get("explanations", {})
         except Exception as e:
             print(f"Error parsing validation response: {e}")
             print(f"Validation response content was: '{response.content}'")
-            # If parsing fails, assume valid to keep game flowing
-            return True, [], {"error": f"Validation parsing failed: {str(e)}"}
+            result = None
+        
+        confidence = result.get("confidence") if result else None
+        self.routing_log.record(RoutingDecision(
+            stage="validation",
+            person=person,
+            model=model,
+            confidence=confidence if isinstance(confidence, (int, float)) else None,
+            escalated=escalation_reason is not None,
+            reason=escalation_reason,
+            latency_seconds=latency
+        ))
+        return result
+
+    def validate_many(self, items: list[tuple[str, list[dict]]], max_batch_size: int = 8) -> list[tuple[bool, list[str], dict]]:
+        """Validate many (person, banned_categories) items with as few LLM calls as possible.
+        
+        Up to `max_batch_size` people go into one request, each checked against
+        their own banned category set; items sharing a set share its rendering.
+        Results come back in input order; items a batch fails to answer fall
+        back to validate_move.
+        """
+        results: list = [None] * len(items)
+        pending: dict[tuple, list[int]] = {}
+        
+        for index, (person, banned_categories) in enumerate(items):
+            if not banned_categories:
+                results[index] = (True, [], {})
+                continue
+            key = verdict_key(person, banned_categories)
+            cached = verdict_cache.get(key)
+            if cached is not None:
+                results[index] = cached
+                continue
+            # Repeats of the same (person, category set) are validated once
+            pending.setdefault(key, []).append(index)
+        
+        # Keep items with the same category set together so batches repeat fewer sets
+        ordered = sorted(pending.items(), key=lambda entry: entry[0][1])
+        for start in range(0, len(ordered), max_batch_size):
+            chunk = ordered[start:start + max_batch_size]
+            verdicts = self._validate_batch([items[indices[0]] for _, indices in chunk])
+            for (_, indices), verdict in zip(chunk, verdicts):
+                for index in indices:
+                    results[index] = verdict
+        
+        return results
+    
+    def _validate_batch(self, batch: list[tuple[str, list[dict]]]) -> list[tuple[bool, list[str], dict]]:
+        """Validate a batch of people in a single request, escalating as needed."""
+        policy = self.routing_policy
+        
+        if policy.cascade_enabled:
+            parsed = self._run_batch_check(batch, policy.fast_model)
+            escalate = {
+                i: reason for i in range(len(batch))
+                if (reason := policy.escalation_reason(parsed.get(i)))
+            }
+            if escalate:
+                logger.info(f"Escalating {len(escalate)} of {len(batch)} batched validations to {policy.strong_model}")
+                retried = self._run_batch_check(
+                    [batch[i] for i in escalate], policy.strong_model, ", ".join(sorted(set(escalate.values())))
+                )
+                for position, i in enumerate(escalate):
+                    parsed[i] = retried.get(position)
+        else:
+            parsed = self._run_batch_check(batch, policy.strong_model)
+        
+        verdicts = []
+        for i, (person, banned_categories) in enumerate(batch):
+            result = parsed.get(i)
+            if result is None or "safe" not in result:
+                # The batch didn't answer for this person; ask about them on their own
+                verdicts.append(self.validate_move(person, banned_categories))
+                continue
+            verdict = (result["safe"], result.get("violations", []), result.get("explanations", {}))
+            verdict_cache.put(verdict_key(person, banned_categories), verdict)
+            verdicts.append(verdict)
+        return verdicts
+    
+    def _run_batch_check(self, batch: list[tuple[str, list[dict]]], model: str, escalation_reason: str = None) -> dict[int, dict]:
+        """Run one batched validation call; returns parsed results keyed by batch position."""
+        set_labels: dict[tuple, str] = {}
+        category_sets = []
+        people = []
+        for i, (person, banned_categories) in enumerate(batch, start=1):
+            set_key = verdict_key(person, banned_categories)[1]
+            if set_key not in set_labels:
+                set_labels[set_key] = f"SET {len(set_labels) + 1}"
+                category_sets.append(
+                    f"{set_labels[set_key]}:\n{self.prompt_budget.render_validator_categories(banned_categories)}"
+                )
+            
+            line = f"ITEM {i}: {person} (check against {set_labels[set_key]})"
+            person_info = person_info_cache.get(normalize_person(person))
+            if person_info is not None:
+                line += f"\n  KNOWN INFORMATION: {json.dumps(person_info)}"
+            people.append(line)
+        
+        messages = [
+            SystemMessage(content=VALIDATOR_SYSTEM_PROMPT),
+            HumanMessage(content=BATCH_VALIDATOR_CHECK_PROMPT.format(
+                category_sets="\n\n".join(category_sets),
+                people="\n".join(people)
+            ))
+        ]
+        
+        started = time.perf_counter()
+        response = self._batch_client(model, len(batch)).invoke(messages)
+        latency = time.perf_counter() - started
+        
+        parsed = {}
+        try:
+            for result in JSONResponseParser.parse_json_response(response.content).get("results", []):
+                position = int(result.get("id", 0)) - 1
+                if 0 <= position < len(batch):
+                    parsed[position] = result
+        except Exception as e:
+            print(f"Error parsing batch validation response: {e}")
+            print(f"Batch validation response content was: '{response.content}'")
+        
+        self.routing_log.record(RoutingDecision(
+            stage="batch_validation",
+            person=", ".join(person for person, _ in batch),
+            model=model,
+            confidence=min(
+                (r["confidence"] for r in parsed.values() if isinstance(r.get("confidence"), (int, float))),
+                default=None
+            ),
+            escalated=escalation_reason is not None,
+            reason=escalation_reason,
+            latency_seconds=latency
+        ))
+        return parsed
+    
+    def _batch_client(self, model: str, batch_size: int) -> ChatAnthropic:
+        """Client with room in max_tokens for a whole batch of verdicts, created on first use."""
+        max_tokens = 150 * batch_size
+        key = (model, max_tokens)
+        if key not in self._batch_llms:
+            self._batch_llms[key] = LLMClientFactory.create_anthropic_client(
+                model_name=model,
+                temperature=0.1,
+                max_tokens=max_tokens,
+                role="validator"
+            )
+        return self._batch_llms[key]
 
 class GameOrchestrator:
     """Orchestrates the No More Jockeys game between human and AI players."""
     
-    def __init__(self, human_player_name: str = None, ai_retry_attempts: int = 2):
+    def __init__(self, human_player_name: str = None, ai_retry_attempts: int = 2, speculative_execution: bool = False,
+                 routing_policy: ModelRoutingPolicy = None):
         """Initialize the game orchestrator.
         
         Args:
             human_player_name: Name of human player, if any
             ai_retry_attempts: Number of retry attempts for AI players when invalid moves are made
+            speculative_execution: Start the next AI turn while the current move is still validating
+            routing_policy: Which models handle player turns and validation; defaults to NMJ_* environment settings
         """
         logger.info(f"Initializing GameOrchestrator with human player: {human_player_name}")
         
@@ -332,12 +576,15 @@ class GameOrchestrator:
             self.human_player_name = human_player_name
             self.has_human = human_player_name is not None
             self.ai_retry_attempts = ai_retry_attempts  # Number of retry attempts for AI players
+            self.routing_policy = routing_policy or ModelRoutingPolicy.from_env()
+            player_model = self.routing_policy.player_model
+            self.prompt_budget = PromptBudgetController.from_env()
             
             if self.has_human:
                 logger.info("Setting up game with human player")
                 # Human is player 1, AI agents are 2-4
                 self.agents = {
-                    i: JockeyAgent(player_id=i) for i in range(2, 5)
+                    i: JockeyAgent(player_id=i, model_name=player_model, prompt_budget=self.prompt_budget) for i in range(2, 5)
                 }
                 self.game_state = GameState(
                     players=[
@@ -353,7 +600,7 @@ class GameOrchestrator:
                 logger.info("Setting up AI-only game")
                 # All AI agents
                 self.agents = {
-                    i: JockeyAgent(player_id=i) for i in range(1, 5)
+                    i: JockeyAgent(player_id=i, model_name=player_model, prompt_budget=self.prompt_budget) for i in range(1, 5)
                 }
                 self.game_state = GameState(
                     players=[Player(id=i, name=f"Claude-{i}", is_human=False) for i in range(1, 5)],
@@ -361,8 +608,14 @@ class GameOrchestrator:
                     moves=[]
                 )
             
-            self.validator = ValidatorAgent()
+            self.validator = ValidatorAgent(routing_policy=self.routing_policy, prompt_budget=self.prompt_budget)
+            # Shared with other games on this worker so concurrent validations share LLM calls;
+            # batched validations use the NMJ_* environment routing policy, not this game's
+            self.batcher = shared_batcher(ValidatorAgent)
             self.pending_human_turn = False
+            self.speculative_execution = speculative_execution
+            self.speculator = TurnSpeculator()
+            self.recorder: Optional[GameRecorder] = None
             logger.info("Successfully initialized GameOrchestrator")
             
         except Exception as e:
@@ -376,6 +629,8 @@ class GameOrchestrator:
         if not current_player:
             return {"error": "Game over", "winner": self._get_winner()}
         
+        speculated = False
+        
         # Handle human player turn
         if current_player.is_human:
             if human_move is None:
@@ -394,66 +649,221 @@ class GameOrchestrator:
                     "reasoning": human_move.get("reasoning", "Human player move")
                 }
                 self.pending_human_turn = False
+                
+                # For human players, validate move normally (no retries)
+                is_valid, violations, explanations = self._validate_move(
+                    self.game_state, current_player, move_data, speculate=True
+                )
         else:
-            # AI agent turn with retry logic
-            agent = self.agents[current_player.id]
+            speculative_result = None
+            if self.speculative_execution:
+                speculative_result = self.speculator.claim(
+                    current_player.id,
+                    turn_fingerprint(self.game_state, current_player)
+                )
             
-            # First attempt
-            move_data = agent.take_turn(self.game_state)
-            is_valid, violations, explanations = self.validator.validate_move(
-                move_data["person"],
-                self.game_state.banned_categories
-            )
+            if speculative_result is not None:
+                speculated = True
+                move_data, is_valid, violations, explanations = speculative_result
+            else:
+                move_data, is_valid, violations, explanations = self._take_ai_turn(
+                    self.game_state, current_player, speculate=True
+                )
+        
+        self._apply_move(self.game_state, current_player, move_data, is_valid, violations)
+        if self.recorder:
+            self._record_turn(current_player, move_data, is_valid, violations, explanations)
+        
+        # A committed speculation leaves the pipeline empty; refill it for the next AI player
+        if speculated:
+            self._speculate_turn(copy.deepcopy(self.game_state))
+        
+        return {
+            "move": move_data,
+            "valid": is_valid,
+            "violations": violations,
+            "explanations": explanations,
+            "game_state": self.game_state.to_dict(),
+            "waiting_for_human": False
+        }
+    
+    @classmethod
+    def from_game_state(cls, game_state: GameState, **kwargs) -> "GameOrchestrator":
+        """Recreate an orchestrator (fresh agents) around a recovered game state."""
+        human = next((p for p in game_state.players if p.is_human), None)
+        orchestrator = cls(human_player_name=human.name if human else None, **kwargs)
+        orchestrator.game_state = game_state
+        return orchestrator
+    
+    def options(self) -> dict:
+        """Constructor options to persist, so a recovered game behaves the same."""
+        return {
+            "ai_retry_attempts": self.ai_retry_attempts,
+            "speculative_execution": self.speculative_execution
+        }
+    
+    def attach_recorder(self, recorder: GameRecorder, record_start: bool = True):
+        """Log every committed turn to an event store from now on."""
+        self.recorder = recorder
+        if record_start:
+            recorder.start(self.game_state)
+    
+    def check_move(self, person: str) -> tuple[bool, list[str], dict]:
+        """Validate a candidate person against the current banned categories without committing.
+        
+        The verdict and person info are cached, so committing the same person
+        afterwards skips both LLM calls.
+        """
+        return self._validate(person, list(self.game_state.banned_categories))
+    
+    def get_stats(self) -> dict:
+        """Report performance counters for this game."""
+        return {
+            "speculative_execution": self.speculative_execution,
+            "speculation": self.speculator.stats.to_dict(),
+            # Batched validations run on the worker-wide validator, so its log is worker-wide too
+            "routing": (self.batcher.validator if self.batcher else self.validator).routing_log.to_dict(),
+            "prompt_budget": self.prompt_budget.stats.to_dict(),
+            "batching": self.batcher.stats() if self.batcher else None,
+            "person_info_cache": person_info_cache.stats(),
+            "verdict_cache": verdict_cache.stats()
+        }
+    
+    def _take_ai_turn(self, game_state: GameState, current_player: Player, speculate: bool = False) -> tuple:
+        """Generate and validate an AI move, retrying on invalid picks.
+        
+        Returns (move_data, is_valid, violations, explanations). Reads but never
+        mutates `game_state`, so it can run against a speculative copy.
+        """
+        agent = self.agents[current_player.id]
+        
+        # First attempt
+        move_data = agent.take_turn(game_state)
+        is_valid, violations, explanations = self._validate_move(
+            game_state, current_player, move_data, speculate
+        )
+        
+        # If invalid and this is an AI player, allow configurable retries
+        if not is_valid:
+            print(f"🔄 AI Player {current_player.id} ({current_player.name}) first attempt failed: {violations}")
             
-            # If invalid and this is an AI player, allow configurable retries
-            if not is_valid:
-                print(f"🔄 AI Player {current_player.id} ({current_player.name}) first attempt failed: {violations}")
+            # Track retry attempts
+            current_move = move_data
+            current_violations = violations
+            
+            for retry_num in range(1, self.ai_retry_attempts + 1):
+                # Generate feedback based on all previous attempts
+                if retry_num == 1:
+                    feedback = f"Your choice '{current_move['person']}' violated: {', '.join(current_violations)}. Choose someone else."
+                else:
+                    # For multiple retries, provide comprehensive feedback
+                    feedback = "Multiple attempts failed. Choose a completely different person who does NOT fall into any banned categories."
                 
-                # Track retry attempts
-                current_move = move_data
-                current_violations = violations
+                print(f"🔄 AI Player {current_player.id} attempting retry {retry_num}/{self.ai_retry_attempts}...")
                 
-                for retry_num in range(1, self.ai_retry_attempts + 1):
-                    # Generate feedback based on all previous attempts
-                    if retry_num == 1:
-                        feedback = f"Your choice '{current_move['person']}' violated: {', '.join(current_violations)}. Choose someone else."
-                    else:
-                        # For multiple retries, provide comprehensive feedback
-                        feedback = "Multiple attempts failed. Choose a completely different person who does NOT fall into any banned categories."
-                    
-                    print(f"🔄 AI Player {current_player.id} attempting retry {retry_num}/{self.ai_retry_attempts}...")
-                    
-                    retry_move_data = agent.take_turn(self.game_state, feedback)
-                    retry_valid, retry_violations, retry_explanations = self.validator.validate_move(
-                        retry_move_data["person"],
-                        self.game_state.banned_categories
-                    )
-                    
-                    if retry_valid:
-                        print(f"✅ AI Player {current_player.id} retry {retry_num} succeeded with: {retry_move_data['person']}")
-                        move_data = retry_move_data
-                        is_valid = retry_valid
-                        violations = retry_violations
-                        explanations = retry_explanations
-                        break
-                    else:
-                        print(f"❌ AI Player {current_player.id} retry {retry_num} failed: {retry_violations}")
-                        # Update for next iteration or final failure
-                        current_move = retry_move_data
-                        current_violations = retry_violations
+                retry_move_data = agent.take_turn(game_state, feedback)
+                retry_valid, retry_violations, retry_explanations = self._validate_move(
+                    game_state, current_player, retry_move_data, speculate
+                )
                 
-                # If all retries failed
-                if not is_valid:
-                    print(f"💀 AI Player {current_player.id} exhausted all {self.ai_retry_attempts} retries. Player will be eliminated.")
+                if retry_valid:
+                    print(f"✅ AI Player {current_player.id} retry {retry_num} succeeded with: {retry_move_data['person']}")
+                    move_data = retry_move_data
+                    is_valid = retry_valid
+                    violations = retry_violations
+                    explanations = retry_explanations
+                    break
+                else:
+                    print(f"❌ AI Player {current_player.id} retry {retry_num} failed: {retry_violations}")
+                    # Update for next iteration or final failure
+                    current_move = retry_move_data
+                    current_violations = retry_violations
+            
+            # If all retries failed
+            if not is_valid:
+                print(f"💀 AI Player {current_player.id} exhausted all {self.ai_retry_attempts} retries. Player will be eliminated.")
         
-        # For human players, validate move normally (no retries)
-        if current_player.is_human:
-            # Validate move
-            is_valid, violations, explanations = self.validator.validate_move(
-                move_data["person"],
-                self.game_state.banned_categories
-            )
+        return move_data, is_valid, violations, explanations
+    
+    def _validate_move(self, game_state: GameState, current_player: Player, move_data: dict, speculate: bool = False) -> tuple:
+        """Validate a proposed move, optionally overlapping the next AI turn with it.
+        
+        With speculation enabled the next AI player starts generating its move
+        as if this one were valid; the speculation is discarded if it is not.
+        """
+        if speculate and self.speculative_execution:
+            hypothetical = copy.deepcopy(game_state)
+            hypothetical_player = next(p for p in hypothetical.players if p.id == current_player.id)
+            self._apply_move(hypothetical, hypothetical_player, move_data, True, [])
+            self._speculate_turn(hypothetical)
+        
+        is_valid, violations, explanations = self._validate(
+            move_data["person"],
+            game_state.banned_categories
+        )
+        
+        if speculate and self.speculative_execution and not is_valid:
+            self.speculator.discard()
+        
+        return is_valid, violations, explanations
+    
+    def _record_turn(self, current_player: Player, move_data: dict, is_valid: bool, violations: list[str], explanations: dict):
+        """Append the events of the turn just applied to the game log."""
+        move = self.game_state.moves[-1]
+        events = [
+            (MOVE_PROPOSED, {
+                "player_id": current_player.id,
+                "person": move.person,
+                "category": move.category,
+                "reasoning": move.reasoning,
+                "timestamp": move.timestamp.isoformat()
+            }),
+            (MOVE_VALIDATED, {
+                "player_id": current_player.id,
+                "valid": is_valid,
+                "violations": violations,
+                "explanations": explanations
+            })
+        ]
+        if is_valid:
+            events.append((CATEGORY_BANNED, dict(self.game_state.banned_categories[-1])))
+        else:
+            events.append((PLAYER_ELIMINATED, {
+                "player_id": current_player.id,
+                "reason": current_player.elimination_reason
+            }))
+        events.append((TURN_ADVANCED, {"current_player_id": self.game_state.current_player_id}))
         
+        try:
+            self.recorder.record_turn(events, self.game_state)
+        except Exception as e:
+            # The in-memory game is still authoritative; losing a log write shouldn't end the turn
+            logger.error(f"Failed to record turn for game {self.game_state.game_id}: {str(e)}")
+    
+    def _validate(self, person: str, banned_categories: list[dict]) -> tuple[bool, list[str], dict]:
+        """Validate through the shared micro-batcher when batching is enabled."""
+        if self.batcher:
+            return self.batcher.validate(person, banned_categories)
+        return self.validator.validate_move(person, banned_categories)
+    
+    def _speculate_turn(self, game_state: GameState):
+        """Start the next AI turn in the background against a private copy of the state."""
+        if len(game_state.get_active_players()) <= 1:
+            return
+        
+        next_player = game_state.get_current_player()
+        if not next_player or next_player.is_human:
+            return
+        
+        self.speculator.launch(
+            next_player.id,
+            turn_fingerprint(game_state, next_player),
+            lambda: self._take_ai_turn(game_state, next_player)
+        )
+    
+    @staticmethod
+    def _apply_move(game_state: GameState, current_player: Player, move_data: dict, is_valid: bool, violations: list[str]):
+        """Record a move and its consequences, then advance the turn."""
         # Create move record
         move = Move(
             player_id=current_player.id,
@@ -466,28 +876,19 @@ class GameOrchestrator:
         )
         
         # Update game state
-        self.game_state.moves.append(move)
+        game_state.moves.append(move)
         current_player.moves.append(move)
         
         if is_valid:
-            self.game_state.add_banned_category(
+            game_state.add_banned_category(
                 move_data["category"],
                 move_data["person"]
             )
         else:
             violation_detail = f"Named {move_data['person']} who is in banned category: {', '.join(violations)}"
-            self.game_state.eliminate_player(current_player.id, violation_detail)
-        
-        self.game_state.advance_turn()
+            game_state.eliminate_player(current_player.id, violation_detail)
         
-        return {
-            "move": move_data,
-            "valid": is_valid,
-            "violations": violations,
-            "explanations": explanations,
-            "game_state": self.game_state.to_dict(),
-            "waiting_for_human": False
-        }
+        game_state.advance_turn()
     
     def _get_winner(self) -> Optional[int]:
         """Get the ID of the winning player, if any."""
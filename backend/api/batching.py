@@ -0,0 +1,117 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class ValidationBatcher:
+    """Gathers concurrent validation requests into batched LLM calls.
+
+    Requests submitted within `window_seconds` of each other (from any game
+    on the worker) are handed to `validator.validate_many` together, which
+    packs them into as few requests as possible. Callers block only on
+    their own item's future.
+    """
+
+    def __init__(self, validator, window_seconds: float = 0.02, max_batch_size: int = 8):
+        self.validator = validator
+        self.window_seconds = window_seconds
+        self.max_batch_size = max_batch_size
+        self.items = 0
+        self.dispatches = 0
+        self.busy_seconds = 0.0
+        self._queue: list[tuple[str, list[dict], Future]] = []
+        self._condition = threading.Condition()
+        self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="nmj-batch")
+        self._collector = threading.Thread(target=self._collect, name="nmj-batch-collector", daemon=True)
+        self._collector.start()
+
+    def submit(self, person: str, banned_categories: list[dict]) -> Future:
+        future = Future()
+        with self._condition:
+            self._queue.append((person, list(banned_categories), future))
+            self._condition.notify()
+        return future
+
+    def validate(self, person: str, banned_categories: list[dict]) -> tuple[bool, list[str], dict]:
+        """Drop-in for ValidatorAgent.validate_move that joins the current batch."""
+        return self.submit(person, banned_categories).result()
+
+    def _collect(self):
+        while True:
+            with self._condition:
+                while not self._queue:
+                    self._condition.wait()
+
+                # Hold the window open for more requests unless a full batch is already waiting
+                deadline = time.monotonic() + self.window_seconds
+                while len(self._queue) < self.max_batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+
+                batch, self._queue = self._queue, []
+
+            # Dispatch off the collector thread so the next window opens immediately
+            self._executor.submit(self._dispatch, batch)
+
+    def _dispatch(self, batch: list[tuple[str, list[dict], Future]]):
+        started = time.perf_counter()
+        try:
+            verdicts = self.validator.validate_many(
+                [(person, banned) for person, banned, _ in batch],
+                max_batch_size=self.max_batch_size
+            )
+        except Exception as e:
+            logger.error(f"Batched validation of {len(batch)} items failed: {str(e)}")
+            for _, _, future in batch:
+                future.set_exception(e)
+            return
+        finally:
+            with self._condition:
+                self.items += len(batch)
+                self.dispatches += 1
+                self.busy_seconds += time.perf_counter() - started
+
+        for (_, _, future), verdict in zip(batch, verdicts):
+            future.set_result(verdict)
+
+    def stats(self) -> dict:
+        llm_calls = self.validator.routing_log.total_calls()
+        with self._condition:
+            return {
+                "items": self.items,
+                "dispatches": self.dispatches,
+                "llm_calls": llm_calls,
+                "calls_per_validated_person": round(llm_calls / self.items, 3) if self.items else 0.0,
+                "avg_items_per_dispatch": round(self.items / self.dispatches, 2) if self.dispatches else 0.0,
+                "items_per_busy_second": round(self.items / self.busy_seconds, 2) if self.busy_seconds else 0.0
+            }
+
+
+_shared_batcher: Optional[ValidationBatcher] = None
+_shared_lock = threading.Lock()
+
+
+def shared_batcher(create_validator: Callable[[], Any]) -> Optional[ValidationBatcher]:
+    """The worker-wide batcher, or None when NMJ_BATCH_WINDOW_MS is unset or 0."""
+    global _shared_batcher
+
+    window_ms = float(os.environ.get("NMJ_BATCH_WINDOW_MS", "0"))
+    if window_ms <= 0:
+        return None
+
+    with _shared_lock:
+        if _shared_batcher is None:
+            _shared_batcher = ValidationBatcher(
+                create_validator(),
+                window_seconds=window_ms / 1000,
+                max_batch_size=int(os.environ.get("NMJ_BATCH_MAX_SIZE", "8"))
+            )
+            logger.info(f"Validation batching enabled with a {window_ms:.0f}ms window")
+    return _shared_batcher
@@ -0,0 +1,87 @@
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+import threading
+
+
+def normalize_person(person: str) -> str:
+    """Canonical cache key for a person's name ("  barack  OBAMA" -> "barack obama")."""
+    return " ".join(person.lower().split())
+
+
+def verdict_key(person: str, banned_categories: list[dict]) -> tuple:
+    """Cache key for a validation verdict; category order does not matter."""
+    return (
+        normalize_person(person),
+        tuple(sorted({" ".join(b["category"].lower().split()) for b in banned_categories}))
+    )
+
+
+class LRUCache:
+    """Thread-safe least-recently-used cache shared across games on a worker."""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict = OrderedDict()
+        self._watched: dict[Hashable, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            if key not in self._data:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            if key in self._watched:
+                self._watched[key] += 1
+            return self._data[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def watch(self, key: Hashable) -> None:
+        """Start counting hits on `key` (used to measure what prefetching saved)."""
+        with self._lock:
+            self._watched.setdefault(key, 0)
+
+    def watched_hits(self) -> dict[Hashable, int]:
+        with self._lock:
+            return dict(self._watched)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._watched.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0
+            }
+
+
+# Facts about a person don't depend on the game, so every game shares them
+person_info_cache = LRUCache(maxsize=4096)
+
+# (person, banned category set) -> (is_valid, violations, explanations)
+verdict_cache = LRUCache(maxsize=4096)
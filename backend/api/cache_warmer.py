@@ -0,0 +1,170 @@
+from collections import Counter
+from typing import Any, Callable, Iterable, Optional
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows: history saves are not locked against other workers
+    fcntl = None
+
+from .cache import normalize_person, person_info_cache
+from .game_state import GameState
+
+logger = logging.getLogger(__name__)
+
+
+# Survives worker restarts on the same host; set NMJ_WARM_HISTORY_PATH to share it more widely
+DEFAULT_HISTORY_PATH = os.path.join(tempfile.gettempdir(), "nmj_name_history.json")
+
+# Games whose saved move counts are remembered, so a recovered game isn't counted twice
+MAX_TRACKED_GAMES = 10000
+
+
+def count_people(game_states: Iterable[GameState], counted: dict[str, int] = None) -> Counter:
+    """How often each person (by normalized name) has been named across games.
+
+    `counted` maps game ids to how many of their moves to skip because they
+    are already included elsewhere.
+    """
+    counted = counted or {}
+    counts = Counter()
+    for game_state in game_states:
+        for move in game_state.moves[counted.get(game_state.game_id, 0):]:
+            if move.person:
+                counts[normalize_person(move.person)] += 1
+    return counts
+
+
+class CacheWarmer:
+    """Prefetches person info for the most frequently named people.
+
+    The ranking combines names from games live on this worker with counts
+    saved by earlier workers at `history_path`, so a new worker can start
+    warm. Each run spends at most `budget` LLM calls, skipping people whose
+    info is already cached.
+
+    The history file also records how many moves of each game have been
+    saved. Every save re-reads it under a file lock and adds only moves no
+    worker has saved yet, so workers sharing the file don't overwrite each
+    other and a game recovered after a crash has its unsaved moves counted.
+    """
+
+    def __init__(self, create_validator: Callable[[], Any], budget: int = 50, history_path: Optional[str] = None):
+        self.budget = budget
+        self.history_path = history_path
+        self.runs = 0
+        self.llm_calls = 0
+        self.fetch_seconds = 0.0
+        self._create_validator = create_validator
+        self._validator = None
+        self._saved_counts, self._saved_moves = self._load_history()
+        self._lock = threading.Lock()
+        # Separate from _lock so saving never waits on a warm run's LLM calls
+        self._counts_lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, create_validator: Callable[[], Any]) -> Optional["CacheWarmer"]:
+        """Warmer configured by NMJ_WARM_* variables, or None when NMJ_WARM_BUDGET is 0."""
+        budget = int(os.environ.get("NMJ_WARM_BUDGET", "0"))
+        if budget <= 0:
+            return None
+        return cls(
+            create_validator,
+            budget=budget,
+            history_path=os.environ.get("NMJ_WARM_HISTORY_PATH") or DEFAULT_HISTORY_PATH
+        )
+
+    def rank_people(self, game_states: Iterable[GameState] = ()) -> list[tuple[str, int]]:
+        """Most frequently named people first."""
+        with self._counts_lock:
+            counts = self._saved_counts + count_people(game_states, self._saved_moves)
+        return counts.most_common()
+
+    def warm(self, game_states: Iterable[GameState] = ()) -> dict:
+        """Prefetch person info for the top-ranked uncached people within the budget."""
+        with self._lock:
+            if self._validator is None:
+                self._validator = self._create_validator()
+
+            ranked = self.rank_people(game_states)
+            if not ranked:
+                logger.warning(f"Cache warmer has no named people to rank; nothing saved at {self.history_path} yet")
+
+            warmed = []
+            started = time.perf_counter()
+            for person, _ in ranked:
+                if len(warmed) >= self.budget:
+                    break
+                if person in person_info_cache:
+                    continue
+
+                fetch_started = time.perf_counter()
+                person_info = self._validator.get_person_info(person)
+                self.fetch_seconds += time.perf_counter() - fetch_started
+                self.llm_calls += 1
+                warmed.append(person)
+
+                if "error" not in person_info:
+                    person_info_cache.watch(person)
+
+            self.runs += 1
+            logger.info(f"Cache warmer prefetched {len(warmed)} people in {time.perf_counter() - started:.1f}s")
+            return {"warmed": len(warmed), "seconds": round(time.perf_counter() - started, 3)}
+
+    def save_history(self, game_states: Iterable[GameState] = ()) -> None:
+        """Add moves no worker has saved yet to the shared name counts."""
+        if not self.history_path:
+            return
+        game_states = list(game_states)
+        with self._counts_lock, open(f"{self.history_path}.lock", "a") as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            # Other workers may have saved since we last read the file
+            saved_counts, saved_moves = self._load_history()
+            saved_counts += count_people(game_states, saved_moves)
+            for game_state in game_states:
+                saved_moves.pop(game_state.game_id, None)
+                saved_moves[game_state.game_id] = len(game_state.moves)
+            # Oldest first, so the least recently saved games are forgotten first
+            saved_moves = dict(list(saved_moves.items())[-MAX_TRACKED_GAMES:])
+
+            tmp_path = f"{self.history_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump({"people": dict(saved_counts.most_common()), "games": saved_moves}, f)
+            os.replace(tmp_path, self.history_path)
+            self._saved_counts, self._saved_moves = saved_counts, saved_moves
+        logger.info(f"Saved {len(saved_counts)} named people to {self.history_path}")
+
+    def _load_history(self) -> tuple[Counter, dict[str, int]]:
+        """(name counts, saved move count per game) from the history file."""
+        if not self.history_path or not os.path.exists(self.history_path):
+            return Counter(), {}
+        try:
+            with open(self.history_path) as f:
+                history = json.load(f)
+            return Counter(history.get("people", {})), dict(history.get("games", {}))
+        except (OSError, ValueError) as e:
+            logger.error(f"Could not read name history {self.history_path}: {str(e)}")
+            return Counter(), {}
+
+    def stats(self) -> dict:
+        """Prefetch effort and the lookup latency it has saved so far."""
+        hits = person_info_cache.watched_hits()
+        used = sum(1 for count in hits.values() if count > 0)
+        avg_fetch = self.fetch_seconds / self.llm_calls if self.llm_calls else 0.0
+        return {
+            "runs": self.runs,
+            "llm_calls": self.llm_calls,
+            "budget_per_run": self.budget,
+            "warmed_entries": len(hits),
+            "warmed_entries_used": used,
+            "warmed_entry_hits": sum(hits.values()),
+            "avg_fetch_seconds": round(avg_fetch, 3),
+            # Each used entry spared its first lookup; later hits would have been cached anyway
+            "first_lookup_seconds_saved": round(used * avg_fetch, 3)
+        }
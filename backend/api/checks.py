@@ -0,0 +1,58 @@
+from typing import Any, Callable, Optional
+import asyncio
+import itertools
+import logging
+
+from starlette.concurrency import run_in_threadpool
+
+logger = logging.getLogger(__name__)
+
+
+class CheckDebouncer:
+    """Debounces dry-run checks per game so only the latest candidate is validated.
+
+    Each check waits `delay_seconds` before calling the LLM. If a newer check
+    for the same game arrives in the meantime, the older one is cancelled
+    without spending any LLM calls. A check superseded while its LLM calls are
+    in flight still completes (warming the caches) but is reported as stale.
+    """
+
+    def __init__(self, delay_seconds: float = 0.3):
+        self.delay_seconds = delay_seconds
+        self.cancelled = 0
+        self.completed = 0
+        self._tickets = itertools.count(1)
+        self._latest: dict[str, int] = {}
+
+    def is_latest(self, key: str, ticket: int) -> bool:
+        return self._latest.get(key) == ticket
+
+    async def run(self, key: str, func: Callable[..., Any], *args) -> tuple[bool, Optional[Any]]:
+        """Run `func(*args)` in a worker thread unless superseded.
+
+        Returns (stale, result); result is None when the check was cancelled
+        before reaching the LLM.
+        """
+        ticket = next(self._tickets)
+        self._latest[key] = ticket
+
+        try:
+            await asyncio.sleep(self.delay_seconds)
+            if not self.is_latest(key, ticket):
+                self.cancelled += 1
+                logger.info(f"Cancelled stale check for game {key}")
+                return True, None
+
+            result = await run_in_threadpool(func, *args)
+            self.completed += 1
+            return not self.is_latest(key, ticket), result
+        finally:
+            # Also on errors and disconnects, so finished games don't leave entries behind
+            if self.is_latest(key, ticket):
+                self._latest.pop(key)
+
+    def stats(self) -> dict:
+        return {
+            "cancelled": self.cancelled,
+            "completed": self.completed
+        }
@@ -0,0 +1,234 @@
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import Iterator, Optional
+import json
+import logging
+import os
+import threading
+import uuid
+
+from .game_state import GameState
+
+logger = logging.getLogger(__name__)
+
+GAME_CREATED = "game_created"
+MOVE_PROPOSED = "move_proposed"
+MOVE_VALIDATED = "move_validated"
+CATEGORY_BANNED = "category_banned"
+PLAYER_ELIMINATED = "player_eliminated"
+TURN_ADVANCED = "turn_advanced"
+
+
+@dataclass
+class GameEvent:
+    """One entry in a game's append-only log."""
+    seq: int
+    type: str
+    data: dict
+    timestamp: str
+
+
+def rebuild_state(snapshot: dict, events: list[GameEvent]) -> GameState:
+    """Rebuild a game from a snapshot plus the events logged after it.
+
+    A turn's events only reach the state once its closing "turn_advanced"
+    arrives, so a turn cut short by a crash is dropped as a whole.
+    """
+    game_state = GameState.from_snapshot(snapshot)
+    turn: list[GameEvent] = []
+
+    for event in events:
+        if event.type == GAME_CREATED:
+            continue
+        turn.append(event)
+        if event.type == TURN_ADVANCED:
+            _apply_turn(game_state, turn)
+            turn = []
+
+    if turn:
+        logger.error(f"Ignoring {len(turn)} events of an unfinished turn after seq {turn[0].seq - 1}")
+    return game_state
+
+
+def _apply_turn(game_state: GameState, events: list[GameEvent]) -> None:
+    proposed: dict = {}
+    for event in events:
+        if event.type == MOVE_PROPOSED:
+            proposed = event.data
+        elif event.type == MOVE_VALIDATED:
+            game_state.apply_event(MOVE_VALIDATED, {**proposed, **event.data})
+        else:
+            game_state.apply_event(event.type, event.data)
+
+
+class EventStore:
+    """Per-game append-only event logs and snapshots on local disk.
+
+    Each game gets `<root>/<game_id>/events.jsonl` (one JSON event per line,
+    never rewritten) and `snapshot.json` (latest compact state, the sequence
+    number it covers, the log offset to resume reading from and the options
+    the game was created with).
+    """
+
+    def __init__(self, root: str, fsync: bool = False):
+        self.root = root
+        self.fsync = fsync
+        os.makedirs(root, exist_ok=True)
+
+    @classmethod
+    def from_env(cls) -> Optional["EventStore"]:
+        """Store at NMJ_EVENT_LOG_DIR, or None when event logging is disabled."""
+        root = os.environ.get("NMJ_EVENT_LOG_DIR")
+        if not root:
+            return None
+        return cls(root, fsync=os.environ.get("NMJ_EVENT_LOG_FSYNC", "0") == "1")
+
+    def _game_dir(self, game_id: str) -> str:
+        # Game ids come from URLs; only accept the UUIDs we issue
+        return os.path.join(self.root, str(uuid.UUID(game_id)))
+
+    def has_game(self, game_id: str) -> bool:
+        try:
+            return os.path.exists(os.path.join(self._game_dir(game_id), "snapshot.json"))
+        except ValueError:
+            return False
+
+    def game_ids(self) -> list[str]:
+        return [name for name in os.listdir(self.root) if self.has_game(name)]
+
+    def append(self, game_id: str, events: list[GameEvent]) -> int:
+        """Append events in a single write; returns the log size afterwards."""
+        path = os.path.join(self._game_dir(game_id), "events.jsonl")
+        lines = "".join(json.dumps(asdict(e), separators=(",", ":")) + "\n" for e in events)
+        with open(path, "a") as f:
+            f.write(lines)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+            return f.tell()
+
+    def write_snapshot(self, game_id: str, seq: int, state: dict, log_offset: int, options: dict = None) -> None:
+        game_dir = self._game_dir(game_id)
+        os.makedirs(game_dir, exist_ok=True)
+        tmp_path = os.path.join(game_dir, "snapshot.json.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(
+                {"seq": seq, "log_offset": log_offset, "state": state, "options": options or {}},
+                f, separators=(",", ":")
+            )
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        os.replace(tmp_path, os.path.join(game_dir, "snapshot.json"))
+
+    def read_snapshot(self, game_id: str) -> dict:
+        with open(os.path.join(self._game_dir(game_id), "snapshot.json")) as f:
+            return json.load(f)
+
+    def options(self, game_id: str) -> dict:
+        """Options the game was created with, to rebuild it the same way."""
+        return self.read_snapshot(game_id).get("options", {})
+
+    def events(self, game_id: str, after_seq: int = 0, offset: int = 0) -> Iterator[GameEvent]:
+        """Logged events with seq > after_seq, starting from a byte offset if known."""
+        for event, _ in self._read(game_id, offset):
+            if event.seq > after_seq:
+                yield event
+
+    def _read(self, game_id: str, offset: int) -> Iterator[tuple[GameEvent, int]]:
+        """Complete events from a byte offset, each with the offset just past its line."""
+        path = os.path.join(self._game_dir(game_id), "events.jsonl")
+        if not os.path.exists(path):
+            return
+        with open(path, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # A torn final line from a crash mid-write
+                    logger.error(f"Ignoring incomplete final line in {path}")
+                    return
+                offset += len(line)
+                try:
+                    event = GameEvent(**json.loads(line))
+                except (ValueError, TypeError):
+                    logger.error(f"Skipping unreadable event in {path}")
+                    continue
+                yield event, offset
+
+    def load(self, game_id: str, repair: bool = True) -> tuple[GameState, int]:
+        """Rebuild a game from its latest snapshot plus tail events; returns (state, last seq).
+
+        With `repair`, anything logged after the last complete turn is cut
+        from the log, so appends resume on a clean line boundary and the
+        unfinished turn can never be replayed. Read-only tools pass False.
+        """
+        snapshot = self.read_snapshot(game_id)
+        tail: list[GameEvent] = []
+        complete, turn_end = 0, snapshot["log_offset"]
+        for event, end in self._read(game_id, snapshot["log_offset"]):
+            if event.seq > snapshot["seq"]:
+                tail.append(event)
+            if event.type in (GAME_CREATED, TURN_ADVANCED):
+                complete, turn_end = len(tail), end
+
+        if repair:
+            self._truncate(game_id, turn_end)
+        tail = tail[:complete]
+        game_state = rebuild_state(snapshot["state"], tail)
+        return game_state, tail[-1].seq if tail else snapshot["seq"]
+
+    def _truncate(self, game_id: str, size: int) -> None:
+        path = os.path.join(self._game_dir(game_id), "events.jsonl")
+        if not os.path.exists(path) or os.path.getsize(path) <= size:
+            return
+        logger.warning(f"Dropping {os.path.getsize(path) - size} bytes of an unfinished turn from {path}")
+        with open(path, "r+b") as f:
+            f.truncate(size)
+            if self.fsync:
+                os.fsync(f.fileno())
+
+
+class GameRecorder:
+    """Writes one game's changes to an EventStore.
+
+    Events of a turn are buffered and appended with one write. Every
+    `snapshot_every` turns a fresh snapshot bounds how much log a recovery
+    has to replay.
+    """
+
+    def __init__(self, store: EventStore, game_id: str, seq: int = 0, snapshot_every: int = 10,
+                 options: dict = None):
+        self.store = store
+        self.game_id = game_id
+        self.seq = seq
+        self.snapshot_every = snapshot_every
+        self.options = options or {}
+        self._turns_since_snapshot = 0
+        self._lock = threading.Lock()
+
+    def start(self, game_state: GameState) -> None:
+        """Record game creation as the first snapshot."""
+        with self._lock:
+            self.seq += 1
+            self.store.write_snapshot(self.game_id, self.seq, game_state.to_snapshot(), 0, self.options)
+            self.store.append(self.game_id, [self._event(GAME_CREATED, {
+                "players": len(game_state.players),
+                "options": self.options
+            })])
+
+    def record_turn(self, events: list[tuple[str, dict]], game_state: GameState) -> None:
+        """Append one turn's events, snapshotting when due."""
+        with self._lock:
+            batch = []
+            for event_type, data in events:
+                self.seq += 1
+                batch.append(self._event(event_type, data))
+            log_offset = self.store.append(self.game_id, batch)
+
+            self._turns_since_snapshot += 1
+            if self._turns_since_snapshot >= self.snapshot_every:
+                self.store.write_snapshot(self.game_id, self.seq, game_state.to_snapshot(), log_offset, self.options)
+                self._turns_since_snapshot = 0
+
+    def _event(self, event_type: str, data: dict) -> GameEvent:
+        return GameEvent(seq=self.seq, type=event_type, data=data, timestamp=datetime.now().isoformat())
@@ -88,6 +88,81 @@ class GameState:
             "turn": len(self.moves)
         })
     
+    def to_snapshot(self) -> dict:
+        """Everything needed to rebuild this state exactly (unlike to_dict, which is for display)."""
+        return {
+            "game_id": self.game_id,
+            "current_player_id": self.current_player_id,
+            "players": [
+                {
+                    "id": p.id,
+                    "name": p.name,
+                    "is_human": p.is_human,
+                    "active": p.active,
+                    "elimination_reason": p.elimination_reason
+                } for p in self.players
+            ],
+            "banned_categories": self.banned_categories,
+            "moves": [
+                {
+                    "player_id": m.player_id,
+                    "person": m.person,
+                    "category": m.category,
+                    "reasoning": m.reasoning,
+                    "timestamp": m.timestamp.isoformat() if m.timestamp else None,
+                    "valid": m.valid,
+                    "violations": m.violations
+                } for m in self.moves
+            ]
+        }
+    
+    @classmethod
+    def from_snapshot(cls, snapshot: dict) -> "GameState":
+        players = [Player(**p) for p in snapshot["players"]]
+        moves = [
+            Move(**{**m, "timestamp": datetime.fromisoformat(m["timestamp"]) if m["timestamp"] else None})
+            for m in snapshot["moves"]
+        ]
+        for move in moves:
+            next(p for p in players if p.id == move.player_id).moves.append(move)
+        
+        return cls(
+            players=players,
+            banned_categories=[dict(b) for b in snapshot["banned_categories"]],
+            moves=moves,
+            current_player_id=snapshot["current_player_id"],
+            game_id=snapshot["game_id"]
+        )
+    
+    def apply_event(self, event_type: str, data: dict):
+        """Replay one logged event (see event_log.py) onto this state.
+        
+        "move_validated" data must carry the proposed move's fields as well;
+        the replayer merges them in from the preceding "move_proposed".
+        """
+        if event_type == "move_validated":
+            move = Move(
+                player_id=data["player_id"],
+                person=data["person"],
+                category=data["category"],
+                reasoning=data["reasoning"],
+                timestamp=datetime.fromisoformat(data["timestamp"]) if data.get("timestamp") else None,
+                valid=data["valid"],
+                violations=data.get("violations", [])
+            )
+            self.moves.append(move)
+            next(p for p in self.players if p.id == move.player_id).moves.append(move)
+        elif event_type == "category_banned":
+            self.banned_categories.append({
+                "category": data["category"],
+                "banned_by": data["banned_by"],
+                "turn": data["turn"]
+            })
+        elif event_type == "player_eliminated":
+            self.eliminate_player(data["player_id"], data["reason"])
+        elif event_type == "turn_advanced":
+            self.current_player_id = data["current_player_id"]
+    
     def to_dict(self) -> dict:
         return {
             "players": [
@@ -1,6 +1,10 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
+import asyncio
+import os
 import uuid
 import logging
 from dotenv import load_dotenv
@@ -15,7 +19,11 @@ load_dotenv()
 logger.info("Starting FastAPI application...")
 
 try:
-    from .agents import GameOrchestrator
+    from .agents import GameOrchestrator, ValidatorAgent
+    from .cache_warmer import CacheWarmer
+    from .event_log import EventStore, GameRecorder
+    from .checks import CheckDebouncer
+    from .spectators import SpectatorHub
     logger.info("Successfully imported GameOrchestrator")
 except Exception as e:
     logger.error(f"Failed to import GameOrchestrator: {str(e)}")
@@ -46,8 +54,113 @@ async def health_check():
 # Simple in-memory game storage
 games = {}
 
+# Optional append-only game log (NMJ_EVENT_LOG_DIR) for crash recovery and replay
+event_store = EventStore.from_env()
+SNAPSHOT_EVERY_TURNS = int(os.environ.get("NMJ_SNAPSHOT_EVERY_TURNS", "10"))
+
+# Turns run in the threadpool so the event loop keeps serving other games and
+# spectators; the lock keeps a game's turns from overlapping
+turn_locks: dict[str, asyncio.Lock] = {}
+
+async def run_turn(game_id: str, human_move: dict = None) -> dict:
+    """Play one turn off the event loop and publish the resulting state"""
+    orchestrator = games[game_id]
+    async with turn_locks.setdefault(game_id, asyncio.Lock()):
+        result = await run_in_threadpool(orchestrator.play_turn, human_move)
+    
+    if "move" in result:
+        spectator_hub.publish(game_id, result["game_state"])
+    
+    return result
+
+# One recovery at a time per game, so concurrent requests share the rebuilt orchestrator
+recovery_locks: dict[str, asyncio.Lock] = {}
+
+def recover_game(game_id: str):
+    """Rebuild a game from the event log with the options it was created with (blocking)"""
+    if not event_store.has_game(game_id):
+        return None
+    
+    game_state, seq = event_store.load(game_id)
+    options = event_store.options(game_id)
+    orchestrator = GameOrchestrator.from_game_state(game_state, **options)
+    orchestrator.attach_recorder(
+        GameRecorder(event_store, game_id, seq=seq, snapshot_every=SNAPSHOT_EVERY_TURNS, options=options),
+        record_start=False
+    )
+    logger.info(f"Recovered game {game_id} from event log at seq {seq}")
+    return orchestrator
+
+async def find_game(game_id: str):
+    """Return the game's orchestrator, recovering it from the event log if this worker lost it"""
+    if game_id in games:
+        return games[game_id]
+    if not event_store:
+        return None
+    
+    async with recovery_locks.setdefault(game_id, asyncio.Lock()):
+        if game_id in games:
+            return games[game_id]
+        try:
+            # Disk reads and LLM client setup stay off the event loop
+            orchestrator = await run_in_threadpool(recover_game, game_id)
+        except Exception as e:
+            logger.error(f"Failed to recover game {game_id}: {str(e)}")
+            return None
+        finally:
+            recovery_locks.pop(game_id, None)
+        
+        if orchestrator is not None:
+            games[game_id] = orchestrator
+        return orchestrator
+
+# The frontend already waits for the user to stop typing; this only collapses
+# checks for the same game that arrive together before calling the LLM
+check_debouncer = CheckDebouncer(
+    delay_seconds=float(os.environ.get("NMJ_CHECK_DEBOUNCE_SECONDS", "0.05"))
+)
+
+# Each state version is encoded once and pushed to every spectator
+spectator_hub = SpectatorHub(
+    max_subscribers_per_game=int(os.environ.get("NMJ_MAX_SPECTATORS_PER_GAME", "10000"))
+)
+SPECTATOR_KEEPALIVE_SECONDS = 15
+
+# Prefetches person info for frequently named people (disabled unless NMJ_WARM_BUDGET is set)
+cache_warmer = CacheWarmer.from_env(ValidatorAgent)
+WARM_INTERVAL_SECONDS = float(os.environ.get("NMJ_WARM_INTERVAL_SECONDS", "0"))
+
+async def run_cache_warmer():
+    """Warm once at startup, then every WARM_INTERVAL_SECONDS if set"""
+    while True:
+        game_states = [orchestrator.game_state for orchestrator in list(games.values())]
+        try:
+            await run_in_threadpool(cache_warmer.warm, game_states)
+            await run_in_threadpool(cache_warmer.save_history, game_states)
+        except Exception as e:
+            logger.error(f"Cache warming failed: {str(e)}")
+        
+        if WARM_INTERVAL_SECONDS <= 0:
+            return
+        await asyncio.sleep(WARM_INTERVAL_SECONDS)
+
+@app.on_event("startup")
+async def start_cache_warmer():
+    if cache_warmer:
+        # Keep a reference so the task isn't garbage collected mid-run
+        app.state.cache_warmer_task = asyncio.create_task(run_cache_warmer())
+
+@app.on_event("shutdown")
+async def save_name_history():
+    if cache_warmer:
+        try:
+            cache_warmer.save_history([orchestrator.game_state for orchestrator in games.values()])
+        except Exception as e:
+            logger.error(f"Failed to save name history: {str(e)}")
+
 class CreateGameRequest(BaseModel):
     human_player_name: str = None
+    speculative_execution: bool = False
 
 class GameAction(BaseModel):
     game_id: str
@@ -58,6 +171,9 @@ class HumanMoveRequest(BaseModel):
     category: str
     reasoning: str = "Human player move"
 
+class CheckMoveRequest(BaseModel):
+    person: str
+
 @app.post("/api/game/create")
 async def create_game(request: CreateGameRequest = CreateGameRequest()):
     """Create a new game instance"""
@@ -69,16 +185,25 @@ async def create_game(request: CreateGameRequest = CreateGameRequest()):
         
         # Create game orchestrator
         orchestrator = GameOrchestrator(
-            human_player_name=request.human_player_name
+            human_player_name=request.human_player_name,
+            speculative_execution=request.speculative_execution
         )
         orchestrator.game_state.game_id = game_id
+        if event_store:
+            orchestrator.attach_recorder(
+                GameRecorder(event_store, game_id, snapshot_every=SNAPSHOT_EVERY_TURNS,
+                             options=orchestrator.options())
+            )
         
         games[game_id] = orchestrator
         logger.info(f"Successfully created game {game_id}")
         
+        game_state = orchestrator.game_state.to_dict()
+        spectator_hub.publish(game_id, game_state)
+        
         return {
             "game_id": game_id,
-            "game_state": orchestrator.game_state.to_dict(),
+            "game_state": game_state,
             "has_human": orchestrator.has_human
         }
         
@@ -92,14 +217,12 @@ async def play_turn(action: GameAction):
     logger.info(f"Playing turn for game {action.game_id}")
     
     try:
-        if action.game_id not in games:
+        if await find_game(action.game_id) is None:
             logger.error(f"Game {action.game_id} not found")
             raise HTTPException(status_code=404, detail="Game not found")
         
-        orchestrator = games[action.game_id]
-        
         # Play turn using orchestrator
-        result = orchestrator.play_turn()
+        result = await run_turn(action.game_id)
         logger.info(f"Successfully played turn for game {action.game_id}")
         
         return result
@@ -113,20 +236,137 @@ async def play_turn(action: GameAction):
 @app.get("/api/game/{game_id}/state")
 async def get_game_state(game_id: str):
     """Get current game state"""
-    if game_id not in games:
+    if await find_game(game_id) is None:
+        raise HTTPException(status_code=404, detail="Game not found")
+    
+    frame = spectator_hub.latest(game_id)
+    if frame is None:
+        frame = spectator_hub.publish(game_id, games[game_id].game_state.to_dict())
+    
+    # Serve the already-encoded version instead of re-serializing per poll
+    return Response(content=frame.payload, media_type="application/json")
+
+@app.get("/api/game/{game_id}/events")
+async def stream_game_state(game_id: str):
+    """Stream game state versions to a spectator as server-sent events"""
+    if await find_game(game_id) is None:
+        raise HTTPException(status_code=404, detail="Game not found")
+    
+    subscriber = spectator_hub.subscribe(game_id, games[game_id].game_state.to_dict)
+    if subscriber is None:
+        raise HTTPException(status_code=503, detail="Too many spectators for this game")
+    
+    async def events():
+        try:
+            while True:
+                try:
+                    frame = await asyncio.wait_for(subscriber.next_frame(), SPECTATOR_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield b": keepalive\n\n"
+                    continue
+                yield frame.sse
+                if frame.final:
+                    break
+        finally:
+            spectator_hub.unsubscribe(game_id, subscriber)
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.websocket("/api/game/{game_id}/ws")
+async def watch_game(websocket: WebSocket, game_id: str):
+    """Push game state versions to a spectator over a WebSocket (binary JSON frames)"""
+    if await find_game(game_id) is None:
+        await websocket.close(code=4404)
+        return
+    
+    subscriber = spectator_hub.subscribe(game_id, games[game_id].game_state.to_dict)
+    if subscriber is None:
+        await websocket.close(code=1013)  # Try again later
+        return
+    
+    await websocket.accept()
+    
+    async def wait_for_disconnect():
+        # Spectators don't send anything; this only notices when they leave
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                return
+    
+    disconnected = asyncio.create_task(wait_for_disconnect())
+    try:
+        while True:
+            next_frame = asyncio.create_task(subscriber.next_frame())
+            done, _ = await asyncio.wait({next_frame, disconnected}, return_when=asyncio.FIRST_COMPLETED)
+            if disconnected in done:
+                next_frame.cancel()
+                break
+            frame = next_frame.result()
+            await websocket.send_bytes(frame.payload)
+            if frame.final:
+                await websocket.close()
+                break
+    except WebSocketDisconnect:
+        pass
+    finally:
+        disconnected.cancel()
+        spectator_hub.unsubscribe(game_id, subscriber)
+
+@app.get("/api/game/{game_id}/stats")
+async def get_game_stats(game_id: str):
+    """Get performance counters for a game"""
+    if await find_game(game_id) is None:
+        raise HTTPException(status_code=404, detail="Game not found")
+    
+    orchestrator = games[game_id]
+    return {
+        **orchestrator.get_stats(),
+        "checks": check_debouncer.stats(),
+        "spectators": spectator_hub.stats(game_id),
+        "cache_warmer": cache_warmer.stats() if cache_warmer else None
+    }
+
+@app.post("/api/game/{game_id}/check")
+async def check_move(game_id: str, request: CheckMoveRequest):
+    """Dry-run a candidate person against the banned categories without changing game state"""
+    if await find_game(game_id) is None:
         raise HTTPException(status_code=404, detail="Game not found")
     
+    person = request.person.strip()
+    if not person:
+        raise HTTPException(status_code=400, detail="Person is required")
+    
     orchestrator = games[game_id]
-    return orchestrator.game_state.to_dict()
+    
+    try:
+        stale, result = await check_debouncer.run(game_id, orchestrator.check_move, person)
+    except Exception as e:
+        logger.error(f"Failed to check move for game {game_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to check move: {str(e)}")
+    
+    if stale:
+        # A newer check for this game superseded this one; the client should ignore it
+        return {"person": person, "stale": True}
+    
+    is_valid, violations, explanations = result
+    return {
+        "person": person,
+        "stale": False,
+        "safe": is_valid,
+        "violations": violations,
+        "explanations": explanations
+    }
 
 @app.post("/api/game/human-move")
 async def make_human_move(request: HumanMoveRequest):
     """Make a move for human player"""
-    if request.game_id not in games:
+    if await find_game(request.game_id) is None:
         raise HTTPException(status_code=404, detail="Game not found")
     
-    orchestrator = games[request.game_id]
-    
     # Play turn with human move
     human_move = {
         "person": request.person,
@@ -134,8 +374,6 @@ async def make_human_move(request: HumanMoveRequest):
         "reasoning": request.reasoning
     }
     
-    result = orchestrator.play_turn(human_move=human_move)
-    
-    return result
+    return await run_turn(request.game_id, human_move)
 
 # FastAPI app is automatically detected by Vercel for ASGI deployment
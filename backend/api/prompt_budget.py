@@ -0,0 +1,177 @@
+from dataclasses import dataclass, field
+from typing import Optional
+import os
+import re
+import threading
+
+GROUPED_NOTE = "(Grouped lines: each item after the colon completes the phrase and is a separate banned category.)"
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token for English)."""
+    return max(1, len(text) // 4)
+
+
+def category_key(category: str) -> tuple[str, ...]:
+    """Canonical form used to spot near-identical categories.
+
+    Only case, punctuation, whitespace, plural endings and a leading "no
+    more" are ignored. Every word is kept, since even tense ("were" vs "are")
+    changes which people a category covers.
+    """
+    text = category.lower().strip()
+    text = re.sub(r"^no more\s+", "", text)
+    words = re.findall(r"[a-z0-9']+", text)
+
+    key = []
+    for word in words:
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        key.append(word)
+    return tuple(key) or (text,)
+
+
+@dataclass
+class CanonicalCategory:
+    """A banned category together with the moves that banned it."""
+    category: str
+    banned_by: list[str] = field(default_factory=list)
+
+
+def deduplicate(banned_categories: list[dict]) -> list[CanonicalCategory]:
+    """Merge near-identical categories, keeping the first wording and every provenance."""
+    merged: dict[tuple, CanonicalCategory] = {}
+    for b in banned_categories:
+        key = category_key(b["category"])
+        if key not in merged:
+            merged[key] = CanonicalCategory(category=b["category"].strip())
+        if b.get("banned_by"):
+            merged[key].banned_by.append(b["banned_by"])
+    return list(merged.values())
+
+
+def group_by_prefix(categories: list[str], max_prefix: int = 4, min_prefix: int = 2) -> list[tuple[str, list[str]]]:
+    """Group categories sharing a leading phrase, e.g. "people born in France/Spain".
+
+    Returns (prefix, suffixes) pairs in first-seen order; ungrouped categories
+    come back with an empty prefix and themselves as the only suffix.
+    """
+    remaining = list(categories)
+    groups: dict[str, tuple[str, list[str]]] = {}
+    first_seen = {c: i for i, c in enumerate(categories)}
+
+    for size in range(max_prefix, min_prefix - 1, -1):
+        buckets: dict[str, list[str]] = {}
+        for category in remaining:
+            words = category.split()
+            if len(words) > size:
+                buckets.setdefault(" ".join(words[:size]).lower(), []).append(category)
+
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            prefix = " ".join(members[0].split()[:size])
+            groups[members[0]] = (prefix, [" ".join(m.split()[size:]) for m in members])
+            remaining = [c for c in remaining if c not in members]
+
+    for category in remaining:
+        groups[category] = ("", [category])
+
+    return [groups[c] for c in sorted(groups, key=first_seen.get)]
+
+
+@dataclass
+class CompactionStats:
+    """Tokens spent on banned-category blocks, as rendered vs uncompacted."""
+    renders: int = 0
+    compacted: int = 0
+    tokens_full: int = 0
+    tokens_rendered: int = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "renders": self.renders,
+            "compacted": self.compacted,
+            "tokens_full": self.tokens_full,
+            "tokens_rendered": self.tokens_rendered,
+            "tokens_saved": self.tokens_full - self.tokens_rendered
+        }
+
+
+class PromptBudgetController:
+    """Keeps the banned-category block of each prompt within a token budget.
+
+    Under budget the block is rendered exactly as before. Over budget it is
+    compacted step by step (merge near-identical categories, drop provenance,
+    group shared prefixes) until it fits. Every distinct category is always
+    kept, so the most compact form may still exceed the budget.
+    """
+
+    def __init__(self, token_budget: Optional[int] = 300):
+        self.token_budget = token_budget
+        self.stats = CompactionStats()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "PromptBudgetController":
+        """Budget from NMJ_PROMPT_TOKEN_BUDGET; 0 disables compaction."""
+        budget = int(os.environ.get("NMJ_PROMPT_TOKEN_BUDGET", "300"))
+        return cls(token_budget=budget or None)
+
+    def render_player_categories(self, banned_categories: list[dict]) -> str:
+        """Banned categories for the player prompt, with provenance while it fits."""
+        full = "\n".join([
+            f"- {b['category']} (banned when {b['banned_by']} was named)"
+            for b in banned_categories
+        ])
+        if self._within_budget(full):
+            return self._record(full, full)
+
+        deduped = deduplicate(banned_categories)
+        with_provenance = "\n".join([
+            f"- {c.category} (banned when {', '.join(c.banned_by)} {'was' if len(c.banned_by) == 1 else 'were'} named)"
+            for c in deduped
+        ])
+        return self._fit(full, [with_provenance] + self._compact_forms(deduped))
+
+    def render_validator_categories(self, banned_categories: list[dict]) -> str:
+        """Banned categories for the validator prompt."""
+        full = "\n".join([f"- {b['category']}" for b in banned_categories])
+        if self._within_budget(full):
+            return self._record(full, full)
+
+        return self._fit(full, self._compact_forms(deduplicate(banned_categories)))
+
+    def _compact_forms(self, deduped: list[CanonicalCategory]) -> list[str]:
+        plain = "\n".join([f"- {c.category}" for c in deduped])
+
+        lines = []
+        for prefix, suffixes in group_by_prefix([c.category for c in deduped]):
+            if prefix:
+                lines.append(f"- {prefix} …: {'; '.join(suffixes)}")
+            else:
+                lines.append(f"- {suffixes[0]}")
+        grouped = "\n".join(lines)
+        if len(lines) < len(deduped):
+            grouped = f"{GROUPED_NOTE}\n{grouped}"
+
+        return [plain, grouped]
+
+    def _within_budget(self, text: str) -> bool:
+        return self.token_budget is None or estimate_tokens(text) <= self.token_budget
+
+    def _fit(self, full: str, candidates: list[str]) -> str:
+        for candidate in candidates:
+            if self._within_budget(candidate):
+                return self._record(full, candidate)
+        # Nothing fits: use the smallest form rather than dropping rules
+        return self._record(full, min(candidates, key=estimate_tokens))
+
+    def _record(self, full: str, rendered: str) -> str:
+        with self._lock:
+            self.stats.renders += 1
+            self.stats.tokens_full += estimate_tokens(full)
+            self.stats.tokens_rendered += estimate_tokens(rendered)
+            if rendered != full:
+                self.stats.compacted += 1
+        return rendered
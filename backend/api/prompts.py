@@ -88,7 +88,9 @@ For each category, determine if the person belongs to it. Be thorough and consid
 - Multiple nationalities or careers
 
 You MUST reply with a single JSON object in this format and **nothing else**:
-{{"violations": ["list", "of", "violated", "categories"], "safe": true/false, "explanations": {{"category": "reason"}}}}"""
+{{"violations": ["list", "of", "violated", "categories"], "safe": true/false, "explanations": {{"category": "reason"}}, "confidence": 0.0-1.0}}
+
+"confidence" is how sure you are of the overall verdict (1.0 = certain)."""
 
 PERSON_INFO_PROMPT = """Provide factual information about {person} focusing on:
 - Nationality/citizenship (all countries)
@@ -98,3 +100,22 @@ PERSON_INFO_PROMPT = """Provide factual information about {person} focusing on:
 
 Be comprehensive but concise. Format as JSON:
 {{"nationalities": [], "occupations": [], "achievements": [], "other_categories": []}}"""
+
+BATCH_VALIDATOR_CHECK_PROMPT = """BATCH CHECK: decide for each person below whether they violate any category in their banned category set.
+
+BANNED CATEGORY SETS:
+{category_sets}
+
+PEOPLE:
+{people}
+
+Judge every person independently, only against the set named on their line. For each category, determine if the person belongs to it. Be thorough and consider:
+- Historical membership (did they EVER belong to this category?)
+- Edge cases (is a racing driver an athlete?)
+- Multiple nationalities or careers
+Where no known information is given, use your own knowledge of the person.
+
+You MUST reply with a single JSON object in this format, with one entry per ITEM id, and **nothing else**:
+{{"results": [{{"id": 1, "violations": ["list", "of", "violated", "categories"], "safe": true/false, "explanations": {{"category": "reason"}}, "confidence": 0.0-1.0}}]}}
+
+"confidence" is how sure you are of that person's verdict (1.0 = certain)."""
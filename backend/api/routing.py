@@ -0,0 +1,117 @@
+from collections import deque
+from dataclasses import dataclass, asdict
+from typing import Optional
+import os
+import threading
+
+DEFAULT_FAST_MODEL = "claude-3-5-haiku-20241022"
+DEFAULT_STRONG_MODEL = "claude-3-5-sonnet-20241022"
+
+
+@dataclass
+class ModelRoutingPolicy:
+    """Decides which model handles each kind of LLM call.
+
+    With the cascade enabled, person info lookups and first-pass validation
+    go to the fast model and only uncertain or disputed verdicts are
+    re-checked by the strong model.
+    """
+    player_model: str = DEFAULT_STRONG_MODEL
+    fast_model: str = DEFAULT_FAST_MODEL
+    strong_model: str = DEFAULT_STRONG_MODEL
+    cascade_enabled: bool = True
+    escalation_threshold: float = 0.8
+    # An unsafe verdict eliminates a player, so always get a second opinion on it
+    escalate_unsafe: bool = True
+
+    @classmethod
+    def from_env(cls) -> "ModelRoutingPolicy":
+        """Build the policy from NMJ_* environment variables."""
+        return cls(
+            player_model=os.environ.get("NMJ_PLAYER_MODEL", DEFAULT_STRONG_MODEL),
+            fast_model=os.environ.get("NMJ_FAST_MODEL", DEFAULT_FAST_MODEL),
+            strong_model=os.environ.get("NMJ_STRONG_MODEL", DEFAULT_STRONG_MODEL),
+            cascade_enabled=os.environ.get("NMJ_MODEL_CASCADE", "1") == "1",
+            escalation_threshold=float(os.environ.get("NMJ_ESCALATION_THRESHOLD", "0.8")),
+            escalate_unsafe=os.environ.get("NMJ_ESCALATE_UNSAFE", "1") == "1"
+        )
+
+    @classmethod
+    def single_model(cls, model_name: str = DEFAULT_STRONG_MODEL) -> "ModelRoutingPolicy":
+        """Route every call to one model, as the game did before the cascade."""
+        return cls(
+            player_model=model_name,
+            fast_model=model_name,
+            strong_model=model_name,
+            cascade_enabled=False
+        )
+
+    @property
+    def person_info_model(self) -> str:
+        return self.fast_model if self.cascade_enabled else self.strong_model
+
+    def escalation_reason(self, result: Optional[dict]) -> Optional[str]:
+        """Why a first-pass validation result needs the strong model, or None to accept it."""
+        if result is None or "safe" not in result:
+            return "unparseable"
+
+        confidence = result.get("confidence")
+        if not isinstance(confidence, (int, float)):
+            return "missing confidence"
+        if confidence < self.escalation_threshold:
+            return "low confidence"
+
+        # The verdict contradicts its own violation list
+        if bool(result["safe"]) == bool(result.get("violations")):
+            return "disputed"
+
+        if self.escalate_unsafe and not result["safe"]:
+            return "unsafe verdict"
+
+        return None
+
+
+@dataclass
+class RoutingDecision:
+    """One routed LLM call."""
+    stage: str  # "person_info", "validation" or "batch_validation"
+    person: str
+    model: str
+    confidence: Optional[float]
+    escalated: bool
+    reason: Optional[str]
+    latency_seconds: float
+
+
+class RoutingLog:
+    """Keeps recent routing decisions and running totals for a validator."""
+
+    def __init__(self, maxlen: int = 200):
+        self.decisions: deque[RoutingDecision] = deque(maxlen=maxlen)
+        self.calls_by_model: dict[str, int] = {}
+        self.validations = 0
+        self.escalations = 0
+        self._lock = threading.Lock()
+
+    def record(self, decision: RoutingDecision) -> None:
+        with self._lock:
+            self.decisions.append(decision)
+            self.calls_by_model[decision.model] = self.calls_by_model.get(decision.model, 0) + 1
+            if decision.stage != "person_info" and not decision.escalated:
+                self.validations += 1
+            if decision.escalated:
+                self.escalations += 1
+
+    def total_calls(self) -> int:
+        with self._lock:
+            return sum(self.calls_by_model.values())
+
+    def to_dict(self, recent: int = 20) -> dict:
+        with self._lock:
+            return {
+                "validations": self.validations,
+                "escalations": self.escalations,
+                "escalation_rate": round(self.escalations / self.validations, 3) if self.validations else 0.0,
+                "calls_by_model": dict(self.calls_by_model),
+                "recent_decisions": [asdict(d) for d in list(self.decisions)[-recent:]]
+            }
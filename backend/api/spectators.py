@@ -0,0 +1,132 @@
+from dataclasses import dataclass
+from typing import Callable, Optional
+import asyncio
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class StateFrame:
+    """One game state version, encoded once and shared by every subscriber."""
+    version: int
+    payload: bytes  # JSON document, also served to /state pollers and WebSocket clients
+    sse: bytes  # the same payload framed as a server-sent event
+    final: bool = False
+
+
+class Subscriber:
+    """A spectator connection that only ever holds the newest unsent frame.
+
+    Each frame is a full snapshot, so a slow consumer skips the versions it
+    had no time to send instead of queueing them. Memory per subscriber stays
+    constant and one slow client never delays the others.
+    """
+
+    def __init__(self):
+        self.skipped = 0
+        self._latest: Optional[StateFrame] = None
+        self._ready = asyncio.Event()
+
+    def offer(self, frame: StateFrame) -> None:
+        if self._latest is not None:
+            self.skipped += 1
+        self._latest = frame
+        self._ready.set()
+
+    async def next_frame(self) -> StateFrame:
+        await self._ready.wait()
+        self._ready.clear()
+        frame, self._latest = self._latest, None
+        return frame
+
+
+class GameChannel:
+    """Latest frame and subscribers for one game."""
+
+    def __init__(self):
+        self.version = 0
+        self.latest: Optional[StateFrame] = None
+        self.subscribers: set[Subscriber] = set()
+        self.skipped = 0
+
+
+class SpectatorHub:
+    """Fans game state out to spectators, encoding each state version once.
+
+    Must be used from the event loop thread: endpoints publish after every
+    state change and SSE/WebSocket handlers subscribe.
+    """
+
+    def __init__(self, max_subscribers_per_game: int = 10000):
+        self.max_subscribers_per_game = max_subscribers_per_game
+        self._channels: dict[str, GameChannel] = {}
+
+    def publish(self, game_id: str, state: dict) -> StateFrame:
+        """Encode a new state version and hand it to every subscriber."""
+        channel = self._channels.setdefault(game_id, GameChannel())
+        return self._push(channel, state)
+
+    def _push(self, channel: GameChannel, state: dict) -> StateFrame:
+        channel.version += 1
+
+        payload = json.dumps(state, separators=(",", ":")).encode()
+        frame = StateFrame(
+            version=channel.version,
+            payload=payload,
+            sse=b"id: %d\nevent: state\ndata: %s\n\n" % (channel.version, payload),
+            final=bool(state.get("game_over"))
+        )
+        channel.latest = frame
+
+        for subscriber in channel.subscribers:
+            subscriber.offer(frame)
+        return frame
+
+    def _release(self, channel: GameChannel) -> None:
+        # A finished game sends nothing more; keep its final frame for /state and
+        # late spectators, but free the subscriber set
+        channel.subscribers = set()
+
+    def latest(self, game_id: str) -> Optional[StateFrame]:
+        channel = self._channels.get(game_id)
+        return channel.latest if channel else None
+
+    def subscribe(self, game_id: str, load_state: Callable[[], dict] = None) -> Optional[Subscriber]:
+        """Register a spectator, primed with the current state; None when the game is full.
+
+        `load_state` supplies the state when the channel has no frame yet,
+        e.g. for a game this worker recovered from the event log.
+        """
+        channel = self._channels.setdefault(game_id, GameChannel())
+        if len(channel.subscribers) >= self.max_subscribers_per_game:
+            logger.info(f"Rejected spectator for game {game_id}: limit reached")
+            return None
+
+        if channel.latest is None and load_state is not None:
+            self._push(channel, load_state())
+
+        subscriber = Subscriber()
+        if channel.latest:
+            subscriber.offer(channel.latest)
+        channel.subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, game_id: str, subscriber: Subscriber) -> None:
+        channel = self._channels.get(game_id)
+        if channel:
+            channel.subscribers.discard(subscriber)
+            channel.skipped += subscriber.skipped
+            if not channel.subscribers and channel.latest and channel.latest.final:
+                self._release(channel)
+
+    def stats(self, game_id: str) -> dict:
+        channel = self._channels.get(game_id)
+        if not channel:
+            return {"subscribers": 0, "version": 0, "skipped_frames": 0}
+        return {
+            "subscribers": len(channel.subscribers),
+            "version": channel.version,
+            "skipped_frames": channel.skipped + sum(s.skipped for s in channel.subscribers)
+        }
@@ -0,0 +1,150 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+import logging
+import threading
+import time
+
+from .game_state import GameState, Player
+
+logger = logging.getLogger(__name__)
+
+# Shared by every game on the worker; speculative turns are I/O bound LLM calls
+_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="nmj-speculation")
+
+
+def turn_fingerprint(game_state: GameState, player: Player) -> tuple:
+    """Identify the game position a turn was generated for.
+
+    A speculative turn may only be committed if the real game reaches exactly
+    the position the speculation assumed.
+    """
+    return (
+        player.id,
+        len(game_state.moves),
+        tuple(b["category"] for b in game_state.banned_categories),
+        tuple(p.id for p in game_state.get_active_players())
+    )
+
+
+@dataclass
+class SpeculationStats:
+    """Counters describing how useful speculative execution has been."""
+    launched: int = 0
+    committed: int = 0
+    discarded: int = 0
+    failed: int = 0
+    latency_saved_seconds: float = 0.0
+
+    @property
+    def wasted_rate(self) -> float:
+        """Fraction of finished speculations whose work was thrown away."""
+        resolved = self.committed + self.discarded + self.failed
+        return (self.discarded + self.failed) / resolved if resolved else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "launched": self.launched,
+            "committed": self.committed,
+            "discarded": self.discarded,
+            "failed": self.failed,
+            "wasted_rate": round(self.wasted_rate, 3),
+            "latency_saved_seconds": round(self.latency_saved_seconds, 3),
+            "avg_latency_saved_seconds": round(
+                self.latency_saved_seconds / self.committed, 3
+            ) if self.committed else 0.0
+        }
+
+
+@dataclass
+class SpeculativeTurn:
+    """A turn being generated ahead of time for an assumed game position."""
+    player_id: int
+    fingerprint: tuple
+    future: Optional[Future]
+    started_at: float
+    finished_at: Optional[float] = None
+
+
+class TurnSpeculator:
+    """Runs at most one speculative AI turn per game in the background."""
+
+    def __init__(self):
+        self.stats = SpeculationStats()
+        self._pending: Optional[SpeculativeTurn] = None
+        self._lock = threading.Lock()
+
+    def launch(self, player_id: int, fingerprint: tuple, work: Callable[[], Any]) -> None:
+        """Start `work` in the background, replacing any unclaimed speculation."""
+        self.discard()
+
+        turn = SpeculativeTurn(
+            player_id=player_id,
+            fingerprint=fingerprint,
+            future=None,
+            started_at=time.perf_counter()
+        )
+
+        def run():
+            try:
+                return work()
+            finally:
+                turn.finished_at = time.perf_counter()
+
+        with self._lock:
+            turn.future = _executor.submit(run)
+            self._pending = turn
+            self.stats.launched += 1
+        logger.info(f"Speculating turn for player {player_id}")
+
+    def discard(self) -> None:
+        """Drop the pending speculation; its result will never be used."""
+        with self._lock:
+            turn, self._pending = self._pending, None
+            if turn is not None:
+                self.stats.discarded += 1
+        if turn is not None:
+            # Only cancels work still queued; running LLM calls finish and are ignored
+            turn.future.cancel()
+            logger.info(f"Discarded speculative turn for player {turn.player_id}")
+
+    def claim(self, player_id: int, fingerprint: tuple) -> Optional[Any]:
+        """Return the speculated result if it was computed for this exact position.
+
+        Blocks until the speculative work finishes if it is already running.
+        Returns None when there is no matching speculation or it has not started
+        yet, in which case the caller runs the turn itself.
+        """
+        with self._lock:
+            turn = self._pending
+            if turn is None:
+                return None
+            if turn.player_id != player_id or turn.fingerprint != fingerprint:
+                self._pending = None
+                self.stats.discarded += 1
+                turn.future.cancel()
+                logger.info(f"Speculative turn for player {turn.player_id} no longer matches game state")
+                return None
+            self._pending = None
+            if turn.future.cancel():
+                # Still queued behind other games' speculations; running inline is faster
+                self.stats.discarded += 1
+                logger.info(f"Speculative turn for player {player_id} had not started, running it inline")
+                return None
+
+        claimed_at = time.perf_counter()
+        try:
+            result = turn.future.result()
+        except Exception as e:
+            logger.error(f"Speculative turn for player {player_id} failed: {str(e)}")
+            with self._lock:
+                self.stats.failed += 1
+            return None
+
+        # Time the speculation had already been running when the turn was requested
+        saved = min(claimed_at, turn.finished_at or claimed_at) - turn.started_at
+        with self._lock:
+            self.stats.committed += 1
+            self.stats.latency_saved_seconds += max(saved, 0.0)
+        logger.info(f"Committed speculative turn for player {player_id}, saved {saved:.2f}s")
+        return result
@@ -0,0 +1,143 @@
+"""Local stand-in for the Anthropic Messages API, for load testing without API credits.
+
+Answers POST /v1/messages with JSON shaped like the game's prompts expect
+(see SimulatedWorld), after a modelled latency. A share of named people are
+judged unsafe so players get eliminated and games end. Error injection
+returns the status codes the real API uses when overloaded or rate limited.
+
+Point the backend at it with ANTHROPIC_BASE_URL=http://127.0.0.1:<port>.
+
+Usage (from backend/):
+    python -m scripts.fake_anthropic --port 9100 --profile realistic --error-rate 0.02
+"""
+from dataclasses import dataclass
+import argparse
+import asyncio
+import itertools
+import json
+import random
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+import uvicorn
+
+from api.prompt_budget import estimate_tokens
+from api.routing import DEFAULT_STRONG_MODEL
+from scripts.simulated_llm import MODEL_PROFILES, SimulatedWorld
+
+
+@dataclass
+class ServerProfile:
+    """How the fake API behaves: latency scaling, jitter and injected failures."""
+    latency_scale: float = 1.0  # multiplier on the per-model latency model
+    jitter: float = 0.25  # lognormal sigma applied to each latency
+    error_rate: float = 0.0  # share of requests answered 529 overloaded
+    rate_limit_rate: float = 0.0  # share of requests answered 429
+    # Share of named people that really violate a banned category. AI players
+    # retry, so an AI elimination needs every attempt to be unsafe
+    # (about unsafe_rate ** 3 per turn with the default two retries).
+    unsafe_rate: float = 0.5
+
+
+PROFILES = {
+    "instant": ServerProfile(latency_scale=0.0, jitter=0.0),
+    "fast": ServerProfile(latency_scale=0.2),
+    "realistic": ServerProfile(latency_scale=1.0),
+    "slow": ServerProfile(latency_scale=3.0, jitter=0.5),
+    "degraded": ServerProfile(latency_scale=1.5, jitter=0.6, error_rate=0.05, rate_limit_rate=0.05),
+}
+
+
+def prompt_text(body: dict) -> tuple[str, str]:
+    """(system prompt, last user message) from a Messages API request body."""
+    def text_of(content) -> str:
+        if isinstance(content, str):
+            return content
+        return "".join(block.get("text", "") for block in content if isinstance(block, dict))
+
+    system = text_of(body.get("system") or "")
+    user = next((text_of(m["content"]) for m in reversed(body.get("messages", [])) if m.get("role") == "user"), "")
+    return system, user
+
+
+def create_app(profile: ServerProfile, seed: int = 0) -> FastAPI:
+    app = FastAPI()
+    world = SimulatedWorld(seed=seed, unsafe_rate=profile.unsafe_rate)
+    rng = random.Random(seed)
+    message_ids = itertools.count(1)
+    counters = {"requests": 0, "errors": 0, "rate_limited": 0}
+
+    @app.get("/health")
+    async def health():
+        return counters
+
+    @app.post("/v1/messages")
+    async def messages(request: Request):
+        body = await request.json()
+        counters["requests"] += 1
+        model = body.get("model", DEFAULT_STRONG_MODEL)
+
+        roll = rng.random()
+        if roll < profile.rate_limit_rate:
+            counters["rate_limited"] += 1
+            return JSONResponse(status_code=429, content={
+                "type": "error", "error": {"type": "rate_limit_error", "message": "Simulated rate limit"}
+            })
+        if roll < profile.rate_limit_rate + profile.error_rate:
+            counters["errors"] += 1
+            return JSONResponse(status_code=529, content={
+                "type": "error", "error": {"type": "overloaded_error", "message": "Simulated overload"}
+            })
+
+        system, user = prompt_text(body)
+        _, text = world.respond(model, user)
+        input_tokens = estimate_tokens(system + user)
+        output_tokens = estimate_tokens(text)
+
+        model_profile = MODEL_PROFILES.get(model, MODEL_PROFILES[DEFAULT_STRONG_MODEL])
+        latency = (model_profile.base_latency + output_tokens * model_profile.per_output_token) * profile.latency_scale
+        if latency and profile.jitter:
+            latency *= rng.lognormvariate(0, profile.jitter)
+        await asyncio.sleep(latency)
+
+        return {
+            "id": f"msg_fake_{next(message_ids)}",
+            "type": "message",
+            "role": "assistant",
+            "model": model,
+            "content": [{"type": "text", "text": text}],
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": {"input_tokens": input_tokens, "output_tokens": output_tokens}
+        }
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="realistic")
+    parser.add_argument("--latency-scale", type=float, help="override the profile's latency multiplier")
+    parser.add_argument("--jitter", type=float, help="override the profile's latency jitter")
+    parser.add_argument("--error-rate", type=float, help="override the profile's 529 rate")
+    parser.add_argument("--rate-limit-rate", type=float, help="override the profile's 429 rate")
+    parser.add_argument("--unsafe-rate", type=float, help="override the share of people judged unsafe")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    base = PROFILES[args.profile]
+    profile = ServerProfile(
+        latency_scale=base.latency_scale if args.latency_scale is None else args.latency_scale,
+        jitter=base.jitter if args.jitter is None else args.jitter,
+        error_rate=base.error_rate if args.error_rate is None else args.error_rate,
+        rate_limit_rate=base.rate_limit_rate if args.rate_limit_rate is None else args.rate_limit_rate,
+        unsafe_rate=base.unsafe_rate if args.unsafe_rate is None else args.unsafe_rate
+    )
+    print(f"Fake Anthropic API on http://{args.host}:{args.port} with {json.dumps(profile.__dict__)}")
+    uvicorn.run(create_app(profile, seed=args.seed), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+"""Load-test the game API at increasing numbers of concurrent games.
+
+Starts a fake Anthropic server (scripts.fake_anthropic) and the backend
+pointed at it, then runs simulated players against the real HTTP API: each
+session creates a game, drives it with /api/game/turn and
+/api/game/human-move (games with a human seat), and polls /state the way
+the frontend does. Reports, per concurrency level, request throughput,
+latency percentiles and error rates per endpoint, and the backend's
+resident memory growth.
+
+Pass --target to test an already running backend instead.
+
+Usage (from backend/):
+    python -m scripts.loadtest --levels 1,5,20,50 --duration 60 --profile realistic
+"""
+from collections import defaultdict
+from dataclasses import dataclass, field
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+import httpx
+
+from scripts.fake_anthropic import PROFILES
+from scripts.simulated_llm import SimulatedWorld, percentile
+
+ENDPOINTS = ["create", "turn", "human-move", "state"]
+
+
+@dataclass
+class LevelResult:
+    """Request samples collected while running one concurrency level."""
+    concurrency: int
+    latencies: dict = field(default_factory=lambda: defaultdict(list))
+    errors: dict = field(default_factory=lambda: defaultdict(int))
+    games_finished: int = 0
+    seconds: float = 0.0
+    rss_before_kb: int = 0
+    rss_after_kb: int = 0
+
+    def record(self, endpoint: str, seconds: float, ok: bool):
+        self.latencies[endpoint].append(seconds)
+        if not ok:
+            self.errors[endpoint] += 1
+
+
+def rss_kb(pid: int) -> int:
+    """Resident set size of a local process, or 0 when it cannot be read."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+async def timed(client: httpx.AsyncClient, result: LevelResult, endpoint: str, method: str, url: str, **kwargs):
+    """Issue one request and record its latency; returns the JSON body or None on failure."""
+    started = time.perf_counter()
+    try:
+        response = await client.request(method, url, **kwargs)
+        ok = response.status_code < 400
+        body = response.json() if ok else None
+    except (httpx.HTTPError, ValueError):
+        ok, body = False, None
+    result.record(endpoint, time.perf_counter() - started, ok)
+    return body
+
+
+async def poll_state(client: httpx.AsyncClient, result: LevelResult, game_id: str, interval: float, done: asyncio.Event):
+    """A spectator polling /state until the game ends."""
+    while not done.is_set():
+        await timed(client, result, "state", "GET", f"/api/game/{game_id}/state")
+        try:
+            await asyncio.wait_for(done.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def play_game(client: httpx.AsyncClient, result: LevelResult, world: SimulatedWorld, args, deadline: float):
+    """Create one game and play it to the end (or until the level's time is up)."""
+    human = world.rng.random() < args.human_share
+    request = {"speculative_execution": args.speculative}
+    if human:
+        request["human_player_name"] = "Load Tester"
+    created = await timed(client, result, "create", "POST", "/api/game/create", json=request)
+    if not created:
+        return
+
+    game_id = created["game_id"]
+    done = asyncio.Event()
+    poller = asyncio.create_task(poll_state(client, result, game_id, args.poll_interval, done))
+
+    try:
+        for _ in range(args.max_turns):
+            if time.monotonic() >= deadline:
+                return
+            turn = await timed(client, result, "turn", "POST", "/api/game/turn", json={"game_id": game_id})
+            if turn is None:
+                return
+            if turn.get("waiting_for_human"):
+                # Think time before the human answers
+                await asyncio.sleep(world.rng.uniform(0, args.think_time))
+                turn = await timed(client, result, "human-move", "POST", "/api/game/human-move", json={
+                    "game_id": game_id,
+                    "person": world.next_person(),
+                    "category": "load test"
+                })
+                if turn is None:
+                    return
+            if "error" in turn or turn.get("game_state", {}).get("game_over"):
+                result.games_finished += 1
+                return
+    finally:
+        done.set()
+        await poller
+
+
+async def session(client: httpx.AsyncClient, result: LevelResult, world: SimulatedWorld, args, deadline: float):
+    """One concurrent player: plays games back to back until the deadline."""
+    while time.monotonic() < deadline:
+        await play_game(client, result, world, args, deadline)
+
+
+async def run_level(concurrency: int, args, backend_pid: int | None) -> LevelResult:
+    result = LevelResult(concurrency=concurrency)
+    limits = httpx.Limits(max_connections=concurrency * 2 + 10)
+    async with httpx.AsyncClient(base_url=args.target, timeout=args.request_timeout, limits=limits) as client:
+        if backend_pid:
+            result.rss_before_kb = rss_kb(backend_pid)
+        started = time.monotonic()
+        deadline = started + args.duration
+        await asyncio.gather(*(
+            session(client, result, SimulatedWorld(seed=args.seed * 1000 + i), args, deadline)
+            for i in range(concurrency)
+        ))
+        result.seconds = time.monotonic() - started
+        if backend_pid:
+            result.rss_after_kb = rss_kb(backend_pid)
+    return result
+
+
+def report(result: LevelResult):
+    total = sum(len(samples) for samples in result.latencies.values())
+    errors = sum(result.errors.values())
+    print(f"\n=== {result.concurrency} concurrent games, {result.seconds:.0f}s ===")
+    print(f"requests: {total}  throughput: {total / result.seconds:.1f} req/s  "
+          f"errors: {errors / total if total else 0:.1%}  games finished: {result.games_finished}")
+    if result.rss_before_kb:
+        growth = (result.rss_after_kb - result.rss_before_kb) / 1024
+        print(f"backend RSS: {result.rss_before_kb / 1024:.0f} MB -> {result.rss_after_kb / 1024:.0f} MB ({growth:+.1f} MB)")
+    print(f"{'endpoint':<12}{'count':>8}{'req/s':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'errors':>9}")
+    for endpoint in ENDPOINTS:
+        samples = result.latencies.get(endpoint, [])
+        if not samples:
+            continue
+        print(f"{endpoint:<12}{len(samples):>8}{len(samples) / result.seconds:>8.1f}"
+              f"{percentile(samples, 50) * 1000:>9.0f}{percentile(samples, 95) * 1000:>9.0f}"
+              f"{percentile(samples, 99) * 1000:>9.0f}{result.errors[endpoint] / len(samples):>9.1%}")
+
+
+def spawn(command: list[str], env: dict) -> subprocess.Popen:
+    return subprocess.Popen([sys.executable, "-m", *command], env=env)
+
+
+async def wait_until_up(url: str, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while True:
+            try:
+                if (await client.get(url)).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            if time.monotonic() >= deadline:
+                raise RuntimeError(f"{url} did not come up within {timeout:.0f}s")
+            await asyncio.sleep(0.2)
+
+
+async def main_async(args):
+    processes = []
+    backend_pid = None
+    try:
+        if not args.target:
+            fake_env = dict(os.environ)
+            processes.append(spawn([
+                "scripts.fake_anthropic", "--port", str(args.fake_port), "--profile", args.profile,
+                *(["--error-rate", str(args.error_rate)] if args.error_rate is not None else []),
+                *(["--rate-limit-rate", str(args.rate_limit_rate)] if args.rate_limit_rate is not None else []),
+                *(["--unsafe-rate", str(args.unsafe_rate)] if args.unsafe_rate is not None else []),
+                *(["--latency-scale", str(args.latency_scale)] if args.latency_scale is not None else []),
+                "--seed", str(args.seed)
+            ], fake_env))
+            await wait_until_up(f"http://127.0.0.1:{args.fake_port}/health")
+
+            backend_env = dict(os.environ)
+            backend_env.update({
+                # Empty rather than unset so a local .env cannot route calls through Helicone
+                "HELICONE_API_KEY": "",
+                "ANTHROPIC_BASE_URL": f"http://127.0.0.1:{args.fake_port}",
+                "ANTHROPIC_API_KEY": backend_env.get("ANTHROPIC_API_KEY") or "load-test"
+            })
+            backend = spawn([
+                "uvicorn", "api.main:app", "--port", str(args.port), "--log-level", "warning"
+            ], backend_env)
+            processes.append(backend)
+            backend_pid = backend.pid
+            args.target = f"http://127.0.0.1:{args.port}"
+            await wait_until_up(f"{args.target}/api/health")
+
+        print(f"Load testing {args.target} ({args.duration:.0f}s per level, fake API profile: {args.profile})")
+        for concurrency in args.levels:
+            report(await run_level(concurrency, args, backend_pid))
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--levels", type=lambda s: [int(n) for n in s.split(",")], default=[1, 5, 20],
+                        help="comma-separated numbers of concurrent games")
+    parser.add_argument("--duration", type=float, default=60.0, help="seconds to run each level")
+    parser.add_argument("--target", help="URL of a running backend; skips starting the backend and fake API")
+    parser.add_argument("--port", type=int, default=8100, help="port for the spawned backend")
+    parser.add_argument("--fake-port", type=int, default=9100, help="port for the spawned fake Anthropic API")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="realistic", help="fake API latency/error profile")
+    parser.add_argument("--error-rate", type=float, help="override the profile's injected 529 rate")
+    parser.add_argument("--rate-limit-rate", type=float, help="override the profile's injected 429 rate")
+    parser.add_argument("--unsafe-rate", type=float, help="override the share of people judged unsafe (drives eliminations)")
+    parser.add_argument("--latency-scale", type=float, help="override the profile's latency multiplier")
+    parser.add_argument("--human-share", type=float, default=0.5, help="share of games with a human seat")
+    parser.add_argument("--think-time", type=float, default=2.0, help="max seconds a simulated human waits before moving")
+    parser.add_argument("--poll-interval", type=float, default=1.0, help="seconds between /state polls per game")
+    parser.add_argument("--max-turns", type=int, default=60, help="turns after which a game is abandoned")
+    parser.add_argument("--speculative", action="store_true", help="create games with speculative execution")
+    parser.add_argument("--request-timeout", type=float, default=120.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
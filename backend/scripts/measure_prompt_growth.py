@@ -0,0 +1,93 @@
+"""Measure prompt tokens per turn on long games, with and without the prompt budget.
+
+Builds long synthetic games (including near-duplicate and related categories,
+as real games produce) and renders the player and validator prompts every turn
+using the current uncompacted rendering and the budgeted one.
+
+Usage (from backend/):
+    python -m scripts.measure_prompt_growth --turns 80 --budget 300
+"""
+import argparse
+import random
+from datetime import datetime
+
+from api.agents import JockeyAgent, ValidatorAgent
+from api.game_state import GameState, Move, Player
+from api.prompt_budget import PromptBudgetController, estimate_tokens
+from api.routing import ModelRoutingPolicy
+from scripts.simulated_llm import SimulatedWorld, simulated_clients
+
+COUNTRIES = ["France", "Brazil", "Japan", "Nigeria", "Canada", "Peru", "Norway", "India", "Egypt", "Chile"]
+AWARDS = ["an Oscar", "a Grammy", "a Nobel Prize", "an Olympic medal", "a Tony", "the Booker Prize"]
+TRAITS = ["athletes", "actors", "politicians", "musicians", "scientists", "authors", "chefs", "painters"]
+
+
+def synthetic_category(rng: random.Random, banned: list[str]) -> str:
+    """A plausible category; some restate an earlier one in different words."""
+    roll = rng.random()
+    if banned and roll < 0.15:
+        earlier = rng.choice(banned)
+        return rng.choice([earlier.lower(), f"people who are {earlier}", earlier.capitalize()])
+    if roll < 0.4:
+        return f"people born in {rng.choice(COUNTRIES)}"
+    if roll < 0.65:
+        return f"people who have won {rng.choice(AWARDS)}"
+    if roll < 0.85:
+        return rng.choice(TRAITS)
+    return f"people whose surname has {rng.randint(3, 12)} letters"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=80)
+    parser.add_argument("--budget", type=int, default=300, help="token budget for the banned-category block")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--report-every", type=int, default=10)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    world = SimulatedWorld(seed=args.seed)
+    current = PromptBudgetController(token_budget=None)
+    budgeted = PromptBudgetController(token_budget=args.budget)
+    with simulated_clients(world):
+        policy = ModelRoutingPolicy.single_model()
+        players = {name: JockeyAgent(player_id=1, prompt_budget=pb) for name, pb in (("current", current), ("budgeted", budgeted))}
+        validators = {name: ValidatorAgent(routing_policy=policy, prompt_budget=pb) for name, pb in (("current", current), ("budgeted", budgeted))}
+
+    game_state = GameState(
+        players=[Player(id=i, name=f"Claude-{i}") for i in range(1, 5)],
+        banned_categories=[],
+        moves=[]
+    )
+    person_info = {"nationalities": ["Simulated"], "occupations": ["placeholder"], "achievements": [], "other_categories": []}
+
+    totals = {"current": [0, 0], "budgeted": [0, 0]}
+    print(f"{'turn':>5}{'banned':>8}{'player now':>12}{'player new':>12}{'valid. now':>12}{'valid. new':>12}")
+    for turn in range(1, args.turns + 1):
+        tokens = {}
+        for name in ("current", "budgeted"):
+            player_tokens = estimate_tokens(players[name].build_turn_prompt(game_state))
+            validator_tokens = estimate_tokens(validators[name].build_check_prompt("Some Person", person_info, game_state.banned_categories))
+            totals[name][0] += player_tokens
+            totals[name][1] += validator_tokens
+            tokens[name] = (player_tokens, validator_tokens)
+
+        if turn % args.report_every == 0 or turn == args.turns:
+            print(f"{turn:>5}{len(game_state.banned_categories):>8}"
+                  f"{tokens['current'][0]:>12}{tokens['budgeted'][0]:>12}"
+                  f"{tokens['current'][1]:>12}{tokens['budgeted'][1]:>12}")
+
+        category = synthetic_category(rng, [b["category"] for b in game_state.banned_categories])
+        person = world.next_person()
+        player_id = (turn - 1) % 4 + 1
+        game_state.moves.append(Move(player_id=player_id, person=person, category=category, reasoning="", timestamp=datetime.now()))
+        game_state.add_banned_category(category, person)
+
+    for i, label in enumerate(("player", "validator")):
+        now, new = totals["current"][i], totals["budgeted"][i]
+        print(f"\nTotal {label} prompt tokens: {now} -> {new} ({new / now - 1:+.1%})", end="")
+    print(f"\nCompaction stats: {budgeted.stats.to_dict()}")
+
+
+if __name__ == "__main__":
+    main()
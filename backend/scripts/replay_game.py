@@ -0,0 +1,48 @@
+"""Replay a logged game turn by turn from its event log.
+
+Usage (from backend/):
+    python -m scripts.replay_game ./game_logs <game_id>
+    python -m scripts.replay_game ./game_logs          # list logged games
+"""
+import argparse
+
+from api.event_log import (
+    CATEGORY_BANNED,
+    MOVE_PROPOSED,
+    MOVE_VALIDATED,
+    PLAYER_ELIMINATED,
+    EventStore
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("log_dir")
+    parser.add_argument("game_id", nargs="?")
+    args = parser.parse_args()
+
+    store = EventStore(args.log_dir)
+    if not args.game_id:
+        for game_id in store.game_ids():
+            print(game_id)
+        return
+
+    for event in store.events(args.game_id):
+        data = event.data
+        if event.type == MOVE_PROPOSED:
+            print(f"[{event.timestamp}] Player {data['player_id']}: {data['person']} - no more {data['category']}")
+        elif event.type == MOVE_VALIDATED and not data["valid"]:
+            print(f"    invalid: {', '.join(data['violations'])}")
+        elif event.type == CATEGORY_BANNED:
+            print(f"    banned: {data['category']}")
+        elif event.type == PLAYER_ELIMINATED:
+            print(f"    eliminated player {data['player_id']}")
+
+    game_state, seq = store.load(args.game_id, repair=False)
+    active = [p.name for p in game_state.get_active_players()]
+    print(f"\n{len(game_state.moves)} moves, {len(game_state.banned_categories)} banned categories, "
+          f"active: {', '.join(active)} (through event {seq})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Compare validation calls and throughput with and without micro-batching.
+
+Simulates several games sharing a worker, each validating a stream of
+candidates concurrently (AI retries, human dry-run checks, tournament
+games). Validations go either straight to ValidatorAgent.validate_move or
+through a ValidationBatcher. Clients sleep for a scaled-down modelled
+latency, so throughput is measured in real time without an API key.
+
+Usage (from backend/):
+    python -m scripts.simulate_batching --games 16 --candidates 10 --window-ms 20
+"""
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from api.agents import ValidatorAgent
+from api.batching import ValidationBatcher
+from api.cache import person_info_cache, verdict_cache
+from api.routing import ModelRoutingPolicy
+from scripts.simulated_llm import SimulatedWorld, simulated_clients
+
+
+def run(args, batched: bool) -> dict:
+    person_info_cache.clear()
+    verdict_cache.clear()
+
+    world = SimulatedWorld(seed=args.seed, time_scale=args.time_scale)
+
+    def play(game: int):
+        banned = [{"category": f"game {game} category {i}", "banned_by": f"Someone {i}"} for i in range(6)]
+        for _ in range(args.candidates):
+            validate(world.next_person(), banned)
+
+    # Batch clients are created on first use, so keep the simulated clients patched throughout
+    with simulated_clients(world):
+        validator = ValidatorAgent(routing_policy=ModelRoutingPolicy.single_model())
+        batcher = ValidationBatcher(validator, window_seconds=args.window_ms / 1000, max_batch_size=args.max_batch) if batched else None
+        validate = batcher.validate if batcher else validator.validate_move
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.games) as pool:
+            list(pool.map(play, range(args.games)))
+        elapsed = time.perf_counter() - started
+
+    people = args.games * args.candidates
+    calls = len(world.ledger.calls)
+    return {
+        "calls": calls,
+        "calls_per_person": calls / people,
+        "throughput": people / elapsed,
+        "input_tokens": sum(c.input_tokens for c in world.ledger.calls),
+        "batcher": batcher.stats() if batcher else None
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=16, help="concurrent games on the worker")
+    parser.add_argument("--candidates", type=int, default=10, help="people validated per game")
+    parser.add_argument("--window-ms", type=float, default=20)
+    parser.add_argument("--max-batch", type=int, default=8)
+    parser.add_argument("--time-scale", type=float, default=0.05, help="fraction of modelled LLM latency to really sleep")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{args.games} games x {args.candidates} candidates, window {args.window_ms:.0f}ms, max batch {args.max_batch}\n")
+    print(f"{'mode':<12}{'LLM calls':>11}{'calls/person':>14}{'people/s':>10}{'input tokens':>14}")
+    results = {}
+    for name, batched in (("one by one", False), ("batched", True)):
+        r = results[name] = run(args, batched)
+        print(f"{name:<12}{r['calls']:>11}{r['calls_per_person']:>14.2f}{r['throughput']:>10.1f}{r['input_tokens']:>14}")
+    print(f"\nBatcher stats: {results['batched']['batcher']}")
+
+
+if __name__ == "__main__":
+    main()
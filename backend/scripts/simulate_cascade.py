@@ -0,0 +1,92 @@
+"""Compare per-turn validation latency and cost: model cascade vs a single model.
+
+Validations run through the real ValidatorAgent with its LLM clients replaced
+by simulated ones, so no API key or network access is needed.
+
+Usage (from backend/):
+    python -m scripts.simulate_cascade --turns 500 --uncertain-rate 0.2
+"""
+import argparse
+import statistics
+
+from api.agents import ValidatorAgent
+from api.cache import person_info_cache, verdict_cache
+from api.routing import ModelRoutingPolicy
+from scripts.simulated_llm import SimulatedWorld, percentile, simulated_clients
+
+
+def run(policy: ModelRoutingPolicy, args) -> dict:
+    """Validate `args.turns` candidates under `policy` and summarise the calls made."""
+    person_info_cache.clear()
+    verdict_cache.clear()
+
+    world = SimulatedWorld(
+        seed=args.seed,
+        uncertain_rate=args.uncertain_rate,
+        fast_error_rate=args.fast_error_rate
+    )
+    with simulated_clients(world):
+        validator = ValidatorAgent(routing_policy=policy)
+
+        latencies, costs = [], []
+        correct = 0
+        for turn in range(args.turns):
+            person = world.next_person()
+            if world.rng.random() < args.unsafe_rate:
+                world.unsafe_people.add(person)
+            # Games run about a dozen turns, so the banned list grows and resets
+            banned = [
+                {"category": f"simulated category {i}", "banned_by": f"Someone {i}"}
+                for i in range(1 + turn % 12)
+            ]
+
+            mark = world.ledger.mark()
+            is_valid, _, _ = validator.validate_move(person, banned)
+            calls = world.ledger.since(mark)
+
+            latencies.append(sum(c.latency for c in calls))
+            costs.append(sum(c.cost for c in calls))
+            correct += is_valid == (person not in world.unsafe_people)
+
+    routing = validator.routing_log.to_dict()
+    return {
+        "mean_latency": statistics.mean(latencies),
+        "p95_latency": percentile(latencies, 95),
+        "mean_cost": statistics.mean(costs),
+        "total_cost": sum(costs),
+        "accuracy": correct / args.turns,
+        "escalation_rate": routing["escalation_rate"],
+        "calls_by_model": routing["calls_by_model"]
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--unsafe-rate", type=float, default=0.1, help="share of candidates that really violate a category")
+    parser.add_argument("--uncertain-rate", type=float, default=0.2, help="share of fast-model verdicts with low confidence")
+    parser.add_argument("--fast-error-rate", type=float, default=0.05, help="share of fast-model verdicts that are wrong")
+    parser.add_argument("--threshold", type=float, default=0.8, help="escalation confidence threshold")
+    args = parser.parse_args()
+
+    results = {
+        "single model": run(ModelRoutingPolicy.single_model(), args),
+        "cascade": run(ModelRoutingPolicy(escalation_threshold=args.threshold), args),
+    }
+
+    print(f"{args.turns} simulated validations per policy\n")
+    print(f"{'policy':<14}{'mean s/turn':>12}{'p95 s/turn':>12}{'$/turn':>11}{'accuracy':>10}{'escalated':>11}")
+    for name, r in results.items():
+        print(f"{name:<14}{r['mean_latency']:>12.2f}{r['p95_latency']:>12.2f}"
+              f"{r['mean_cost']:>11.5f}{r['accuracy']:>10.1%}{r['escalation_rate']:>11.1%}")
+
+    baseline, cascade = results["single model"], results["cascade"]
+    print(f"\nLatency change: {cascade['mean_latency'] / baseline['mean_latency'] - 1:+.1%}")
+    print(f"Cost change:    {cascade['total_cost'] / baseline['total_cost'] - 1:+.1%}")
+    for name, r in results.items():
+        print(f"Calls by model ({name}): {r['calls_by_model']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""In-process stand-in for ChatAnthropic used by the simulation scripts.
+
+Each call is charged a modelled latency and token cost instead of hitting the
+API, and answers with JSON shaped like the real prompts expect.
+"""
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from unittest import mock
+import json
+import math
+import random
+import re
+import threading
+import time
+
+from api.agents import LLMClientFactory
+from api.prompt_budget import estimate_tokens
+from api.routing import DEFAULT_FAST_MODEL, DEFAULT_STRONG_MODEL
+
+
+@dataclass
+class ModelProfile:
+    """Latency and price model for one Anthropic model."""
+    base_latency: float  # seconds to first token
+    per_output_token: float  # seconds per generated token
+    input_price: float  # USD per million input tokens
+    output_price: float  # USD per million output tokens
+
+
+MODEL_PROFILES = {
+    DEFAULT_FAST_MODEL: ModelProfile(0.35, 0.006, 0.80, 4.00),
+    DEFAULT_STRONG_MODEL: ModelProfile(0.90, 0.015, 3.00, 15.00),
+}
+
+
+@dataclass
+class CallRecord:
+    model: str
+    kind: str
+    input_tokens: int
+    output_tokens: int
+    latency: float
+    cost: float
+
+
+@dataclass
+class Ledger:
+    """Every simulated call, so a harness can total latency and cost per turn."""
+    calls: list[CallRecord] = field(default_factory=list)
+
+    def mark(self) -> int:
+        return len(self.calls)
+
+    def since(self, mark: int) -> list[CallRecord]:
+        return self.calls[mark:]
+
+
+class SimulatedWorld:
+    """Ground truth and model behaviour shared by all simulated clients.
+
+    `unsafe_people` are the names that really violate a banned category;
+    with `unsafe_rate` set, each newly validated name joins them with that
+    probability. The fast model is uncertain on `uncertain_rate` of
+    validations and wrong on `fast_error_rate` of them; the strong model is
+    always right.
+    """
+
+    def __init__(self, seed: int = 0, uncertain_rate: float = 0.2, fast_error_rate: float = 0.05,
+                 time_scale: float = 0.0, unsafe_rate: float = 0.0):
+        self.rng = random.Random(seed)
+        # Fraction of the modelled latency clients really sleep; 0 keeps simulations instant
+        self.time_scale = time_scale
+        self._lock = threading.Lock()
+        self.uncertain_rate = uncertain_rate
+        self.fast_error_rate = fast_error_rate
+        self.unsafe_rate = unsafe_rate
+        self.unsafe_people: set[str] = set()
+        self._judged: set[str] = set()
+        self.ledger = Ledger()
+        self._people = 0
+
+    def next_person(self) -> str:
+        with self._lock:
+            self._people += 1
+            return f"Person {self._people}"
+
+    def respond(self, model: str, prompt: str) -> tuple[str, str]:
+        """Return (call kind, response text) for a prompt."""
+        if "It's your turn" in prompt:
+            person = self.next_person()
+            return "turn", json.dumps({
+                "person": person,
+                "category": f"people like {person}",
+                "reasoning": "Simulated move"
+            })
+
+        if "Provide factual information" in prompt:
+            return "person_info", json.dumps({
+                "nationalities": ["Simulated"],
+                "occupations": ["placeholder occupation"],
+                "achievements": ["placeholder achievement"],
+                "other_categories": []
+            })
+
+        if "BATCH CHECK" in prompt:
+            items = re.findall(r'^ITEM (\d+): (.+?) \(check against SET \d+\)$', prompt, re.MULTILINE)
+            return "batch_validation", json.dumps({
+                "results": [
+                    {"id": int(item_id), **self._verdict(model, person)}
+                    for item_id, person in items
+                ]
+            })
+
+        match = re.search(r'^PERSON: (.+)$', prompt, re.MULTILINE)
+        person = match.group(1).strip() if match else ""
+        return "validation", json.dumps(self._verdict(model, person))
+
+    def _verdict(self, model: str, person: str) -> dict:
+        with self._lock:
+            # Decided once per name so a later (e.g. escalated) check agrees
+            if self.unsafe_rate and person not in self._judged:
+                self._judged.add(person)
+                if self.rng.random() < self.unsafe_rate:
+                    self.unsafe_people.add(person)
+        safe = person not in self.unsafe_people
+        confidence = 0.97
+        if model != DEFAULT_STRONG_MODEL:
+            with self._lock:
+                if self.rng.random() < self.fast_error_rate:
+                    safe = not safe
+                confidence = 0.55 if self.rng.random() < self.uncertain_rate else 0.93
+
+        return {
+            "violations": [] if safe else ["simulated category"],
+            "safe": safe,
+            "explanations": {} if safe else {"simulated category": "Simulated violation"},
+            "confidence": confidence
+        }
+
+
+class SimulatedLLM:
+    """Drop-in for ChatAnthropic.invoke that records instead of calling the API."""
+
+    def __init__(self, world: SimulatedWorld, model_name: str):
+        self.world = world
+        self.model = model_name
+        self.profile = MODEL_PROFILES.get(model_name, MODEL_PROFILES[DEFAULT_STRONG_MODEL])
+
+    def invoke(self, messages):
+        prompt = "\n".join(m.content for m in messages)
+        kind, content = self.world.respond(self.model, messages[-1].content)
+
+        input_tokens = estimate_tokens(prompt)
+        output_tokens = estimate_tokens(content)
+        latency = self.profile.base_latency + output_tokens * self.profile.per_output_token
+        self.world.ledger.calls.append(CallRecord(
+            model=self.model,
+            kind=kind,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            latency=latency,
+            cost=(input_tokens * self.profile.input_price + output_tokens * self.profile.output_price) / 1_000_000
+        ))
+        if self.world.time_scale:
+            time.sleep(latency * self.world.time_scale)
+        return SimpleNamespace(content=content)
+
+
+@contextmanager
+def simulated_clients(world: SimulatedWorld):
+    """Make every LLM client created inside the block a SimulatedLLM."""
+    def create(model_name, temperature, max_tokens, role=None, player_id=None):
+        return SimulatedLLM(world, model_name)
+
+    with mock.patch.object(LLMClientFactory, "create_anthropic_client", side_effect=create):
+        yield
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
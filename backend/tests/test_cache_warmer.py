@@ -0,0 +1,56 @@
+from datetime import datetime
+import json
+
+from api.cache_warmer import CacheWarmer
+from api.game_state import GameState, Move, Player
+
+
+def game(game_id: str, people: list[str]) -> GameState:
+    return GameState(
+        players=[Player(id=1, name="Claude-1")],
+        banned_categories=[],
+        moves=[Move(1, person, "category", "test", datetime.now()) for person in people],
+        game_id=game_id
+    )
+
+
+def saved_people(path) -> dict:
+    with open(path) as f:
+        return json.load(f)["people"]
+
+
+def test_workers_sharing_a_history_file_keep_each_others_counts(tmp_path):
+    path = str(tmp_path / "history.json")
+    first = CacheWarmer(lambda: None, history_path=path)
+    second = CacheWarmer(lambda: None, history_path=path)
+
+    first.save_history([game("g1", ["Tom Hanks"])])
+    second.save_history([game("g2", ["Cher"])])
+    first.save_history([game("g1", ["Tom Hanks", "Cher"])])
+
+    assert saved_people(path) == {"tom hanks": 1, "cher": 2}
+
+
+def test_saving_again_does_not_double_count(tmp_path):
+    path = str(tmp_path / "history.json")
+    warmer = CacheWarmer(lambda: None, history_path=path)
+    played = game("g1", ["Tom Hanks", "Cher"])
+
+    warmer.save_history([played])
+    warmer.save_history([played])
+
+    assert saved_people(path) == {"tom hanks": 1, "cher": 1}
+
+
+def test_recovered_game_counts_only_moves_never_saved(tmp_path):
+    path = str(tmp_path / "history.json")
+    crashed = CacheWarmer(lambda: None, history_path=path)
+    crashed.save_history([game("g1", ["Tom Hanks"])])
+    # The worker crashed after a second move, before saving again
+
+    recovering = CacheWarmer(lambda: None, history_path=path)
+    recovered = game("g1", ["Tom Hanks", "Cher"])
+    assert dict(recovering.rank_people([recovered])) == {"tom hanks": 1, "cher": 1}
+
+    recovering.save_history([recovered])
+    assert saved_people(path) == {"tom hanks": 1, "cher": 1}
@@ -0,0 +1,88 @@
+from datetime import datetime
+import copy
+import os
+import uuid
+
+from api.event_log import (
+    CATEGORY_BANNED,
+    MOVE_PROPOSED,
+    MOVE_VALIDATED,
+    TURN_ADVANCED,
+    EventStore,
+    GameRecorder
+)
+from api.game_state import GameState, Move, Player
+
+
+def new_game() -> GameState:
+    return GameState(
+        players=[Player(id=i, name=f"Claude-{i}") for i in range(1, 4)],
+        banned_categories=[],
+        moves=[],
+        game_id=str(uuid.uuid4())
+    )
+
+
+def play_valid_turn(game_state: GameState, recorder: GameRecorder, person: str, category: str):
+    """Apply a valid move the way GameOrchestrator does and record its events."""
+    player_id = game_state.current_player_id
+    move = Move(player_id=player_id, person=person, category=category, reasoning="test", timestamp=datetime.now())
+    game_state.moves.append(move)
+    game_state.players[player_id - 1].moves.append(move)
+    banned = {"category": category, "banned_by": person, "turn": len(game_state.moves)}
+    game_state.banned_categories.append(banned)
+    game_state.advance_turn()
+
+    recorder.record_turn([
+        (MOVE_PROPOSED, {
+            "player_id": player_id,
+            "person": person,
+            "category": category,
+            "reasoning": "test",
+            "timestamp": move.timestamp.isoformat()
+        }),
+        (MOVE_VALIDATED, {"player_id": player_id, "valid": True, "violations": [], "explanations": {}}),
+        (CATEGORY_BANNED, dict(banned)),
+        (TURN_ADVANCED, {"current_player_id": game_state.current_player_id})
+    ], game_state)
+
+
+def test_torn_final_turn_is_dropped_and_appends_resume(tmp_path):
+    store = EventStore(str(tmp_path))
+    game_state = new_game()
+    recorder = GameRecorder(store, game_state.game_id)
+    recorder.start(game_state)
+
+    play_valid_turn(game_state, recorder, "Tom Hanks", "actors")
+    after_first_turn = copy.deepcopy(game_state.to_snapshot())
+    play_valid_turn(game_state, recorder, "Serena Williams", "tennis players")
+
+    # Crash mid-write: the second turn's closing turn_advanced line is cut short
+    log_path = os.path.join(str(tmp_path), game_state.game_id, "events.jsonl")
+    with open(log_path, "rb+") as f:
+        f.truncate(os.path.getsize(log_path) - 10)
+
+    recovered, seq = store.load(game_state.game_id)
+    assert recovered.to_snapshot() == after_first_turn
+    assert open(log_path, "rb").read().endswith(b"\n")
+
+    # The recovered game keeps playing and its log stays readable
+    recorder = GameRecorder(store, game_state.game_id, seq=seq)
+    play_valid_turn(recovered, recorder, "Marie Curie", "scientists")
+
+    reloaded, _ = store.load(game_state.game_id)
+    assert reloaded.to_snapshot() == recovered.to_snapshot()
+    assert [m.person for m in reloaded.moves] == ["Tom Hanks", "Marie Curie"]
+
+
+def test_options_survive_snapshots(tmp_path):
+    store = EventStore(str(tmp_path))
+    game_state = new_game()
+    options = {"ai_retry_attempts": 2, "speculative_execution": True}
+    recorder = GameRecorder(store, game_state.game_id, snapshot_every=1, options=options)
+    recorder.start(game_state)
+    assert store.options(game_state.game_id) == options
+
+    play_valid_turn(game_state, recorder, "Tom Hanks", "actors")
+    assert store.read_snapshot(game_state.game_id)["seq"] == recorder.seq
+    assert store.options(game_state.game_id) == options
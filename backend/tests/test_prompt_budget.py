@@ -0,0 +1,51 @@
+import pytest
+
+from api.prompt_budget import category_key, deduplicate, group_by_prefix
+
+# Differ only in tense or aspect, so they cover different people
+DISTINCT_PAIRS = [
+    ("people who were presidents", "people who are presidents"),
+    ("people who had a beard", "people who have a beard"),
+    ("people who have been arrested", "people who are arrested"),
+]
+
+
+@pytest.mark.parametrize("first, second", DISTINCT_PAIRS)
+def test_category_key_keeps_tense(first, second):
+    assert category_key(first) != category_key(second)
+
+
+@pytest.mark.parametrize("first, second", [
+    ("People who are Presidents", "people who are presidents"),
+    ("people who are presidents.", "people  who are  presidents"),
+    ("people who are president", "people who are presidents"),
+    ("No more people who are presidents", "people who are presidents"),
+])
+def test_category_key_ignores_formatting_and_plurals(first, second):
+    assert category_key(first) == category_key(second)
+
+
+@pytest.mark.parametrize("first, second", DISTINCT_PAIRS)
+def test_deduplicate_keeps_both_rules(first, second):
+    deduped = deduplicate([
+        {"category": first, "banned_by": "Someone 1"},
+        {"category": second, "banned_by": "Someone 2"},
+    ])
+    assert [c.category for c in deduped] == [first, second]
+
+
+def test_deduplicate_merges_formatting_variants():
+    deduped = deduplicate([
+        {"category": "people who are presidents", "banned_by": "Someone 1"},
+        {"category": "People who are Presidents.", "banned_by": "Someone 2"},
+    ])
+    assert len(deduped) == 1
+    assert deduped[0].category == "people who are presidents"
+    assert deduped[0].banned_by == ["Someone 1", "Someone 2"]
+
+
+@pytest.mark.parametrize("first, second", DISTINCT_PAIRS)
+def test_group_by_prefix_keeps_both_rules(first, second):
+    groups = group_by_prefix([first, second])
+    rendered = [f"{prefix} {suffix}".strip() for prefix, suffixes in groups for suffix in suffixes]
+    assert sorted(rendered) == sorted([first, second])
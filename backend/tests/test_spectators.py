@@ -0,0 +1,32 @@
+import asyncio
+
+from api.spectators import SpectatorHub
+
+
+def test_finished_game_keeps_its_final_frame():
+    async def scenario():
+        hub = SpectatorHub()
+        hub.publish("g1", {"game_over": False})
+        subscriber = hub.subscribe("g1")
+        final = hub.publish("g1", {"game_over": True})
+        assert (await subscriber.next_frame()) is final
+        hub.unsubscribe("g1", subscriber)
+
+        # /state polls and late spectators reuse the frame instead of re-encoding
+        assert hub.latest("g1") is final
+        late = hub.subscribe("g1", load_state=lambda: {"game_over": True})
+        assert (await late.next_frame()) is final
+        assert hub.stats("g1")["version"] == 2
+
+    asyncio.run(scenario())
+
+
+def test_channel_without_frame_is_primed_from_game_state():
+    async def scenario():
+        hub = SpectatorHub()
+        subscriber = hub.subscribe("g1", load_state=lambda: {"turn_number": 3})
+        frame = await subscriber.next_frame()
+        assert frame.version == 1
+        assert frame.payload == b'{"turn_number":3}'
+
+    asyncio.run(scenario())
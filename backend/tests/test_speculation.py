@@ -0,0 +1,133 @@
+from concurrent.futures import ThreadPoolExecutor, wait
+import threading
+
+import pytest
+
+from api import speculation
+from api.speculation import TurnSpeculator
+
+
+def test_fingerprint_mismatch_discards():
+    speculator = TurnSpeculator()
+    speculator.launch(2, ("position", 1), lambda: "move")
+
+    assert speculator.claim(2, ("position", 2)) is None
+    assert speculator.stats.discarded == 1
+    assert speculator.stats.committed == 0
+
+
+def test_claim_runs_inline_while_speculation_is_queued(monkeypatch):
+    monkeypatch.setattr(speculation, "_executor", ThreadPoolExecutor(max_workers=1))
+    release = threading.Event()
+    other_game = TurnSpeculator()
+    other_game.launch(1, ("other",), release.wait)
+
+    speculator = TurnSpeculator()
+    speculator.launch(2, ("position",), lambda: "move")
+
+    # Queued behind the other game's work: the caller runs the turn itself
+    assert speculator.claim(2, ("position",)) is None
+    assert speculator.stats.discarded == 1
+    release.set()
+
+
+def test_failed_speculation_returns_none():
+    def fail():
+        raise RuntimeError("LLM unavailable")
+
+    speculator = TurnSpeculator()
+    speculator.launch(2, ("position",), fail)
+    wait([speculator._pending.future])
+
+    assert speculator.claim(2, ("position",)) is None
+    assert speculator.stats.failed == 1
+
+
+class ScriptedAgent:
+    """Stands in for JockeyAgent, returning (or raising) scripted moves in order."""
+
+    def __init__(self, player_id: int, results: list = None):
+        self.player_id = player_id
+        self.results = list(results or [])
+        self.calls = 0
+
+    def take_turn(self, game_state, feedback: str = None) -> dict:
+        self.calls += 1
+        result = self.results.pop(0) if self.results else None
+        if isinstance(result, Exception):
+            raise result
+        person = result or f"Person {self.player_id}-{self.calls}"
+        return {"person": person, "category": f"people like {person}", "reasoning": "test"}
+
+
+class StubValidator:
+    """Stands in for ValidatorAgent; only names in `unsafe` violate a category."""
+
+    def __init__(self, unsafe: set[str] = None):
+        self.unsafe = unsafe or set()
+
+    def validate_move(self, person: str, banned_categories: list[dict]) -> tuple[bool, list[str], dict]:
+        if person in self.unsafe:
+            return False, ["stub category"], {"stub category": "test"}
+        return True, [], {}
+
+
+@pytest.fixture
+def make_orchestrator(monkeypatch):
+    agents = pytest.importorskip("api.agents")
+    monkeypatch.delenv("NMJ_BATCH_WINDOW_MS", raising=False)
+    monkeypatch.setattr(agents.LLMClientFactory, "create_anthropic_client", lambda *args, **kwargs: None)
+
+    def make(human_player_name: str = None, unsafe: set[str] = None, scripts: dict = None):
+        orchestrator = agents.GameOrchestrator(human_player_name=human_player_name, speculative_execution=True)
+        orchestrator.agents = {
+            player_id: ScriptedAgent(player_id, (scripts or {}).get(player_id))
+            for player_id in orchestrator.agents
+        }
+        orchestrator.validator = StubValidator(unsafe)
+        return orchestrator
+
+    return make
+
+
+def wait_for_speculation(orchestrator):
+    pending = orchestrator.speculator._pending
+    assert pending is not None
+    wait([pending.future])
+
+
+def test_invalid_move_discards_speculation(make_orchestrator):
+    orchestrator = make_orchestrator(human_player_name="Tester", unsafe={"Banned Person"})
+
+    result = orchestrator.play_turn(human_move={"person": "Banned Person", "category": "banned people"})
+
+    assert result["valid"] is False
+    assert orchestrator.speculator.stats.launched == 1
+    assert orchestrator.speculator.stats.discarded == 1
+    assert orchestrator.speculator._pending is None
+
+
+def test_failed_speculation_falls_back_to_normal_turn(make_orchestrator):
+    orchestrator = make_orchestrator(scripts={2: [RuntimeError("LLM unavailable")]})
+
+    orchestrator.play_turn()
+    wait_for_speculation(orchestrator)
+    result = orchestrator.play_turn()
+
+    assert result["valid"] is True
+    assert result["move"]["person"] == "Person 2-2"
+    assert orchestrator.speculator.stats.failed == 1
+    assert orchestrator.game_state.moves[-1].player_id == 2
+
+
+def test_ai_only_game_refills_pipeline_after_commit(make_orchestrator):
+    orchestrator = make_orchestrator()
+
+    orchestrator.play_turn()
+    wait_for_speculation(orchestrator)
+    result = orchestrator.play_turn()
+
+    assert result["move"]["person"] == "Person 2-1"
+    assert orchestrator.speculator.stats.committed == 1
+    assert orchestrator.speculator.stats.launched == 2
+    assert orchestrator.speculator._pending.player_id == 3
@@ -12,6 +12,7 @@ export default function Home() {
   const [isHuman, setIsHuman] = useState(false);
   const [waitingForHuman, setWaitingForHuman] = useState(false);
   const [humanMove, setHumanMove] = useState({ person: '', category: '' });
+  const [personCheck, setPersonCheck] = useState(null);
   const [darkMode, setDarkMode] = useState(false);
 
   // API URL configuration based on environment
@@ -154,6 +155,50 @@ export default function Home() {
     setLoading(false);
   };
 
+  // Dry-run check of the candidate person while the human is typing
+  useEffect(() => {
+    const person = humanMove.person.trim();
+    if (!gameId || !waitingForHuman || !person) {
+      setPersonCheck(null);
+      return;
+    }
+
+    const controller = new AbortController();
+    const timer = setTimeout(async () => {
+      setPersonCheck({ person, status: 'checking' });
+      try {
+        const res = await fetch(`${API_URL}/api/game/${gameId}/check`, {
+          method: 'POST',
+          headers: { 'Content-Type': 'application/json' },
+          body: JSON.stringify({ person }),
+          signal: controller.signal,
+        });
+        if (!res.ok) {
+          // Error bodies have no verdict; don't present them as a ban
+          setPersonCheck({ person, status: 'error' });
+          return;
+        }
+        const data = await res.json();
+        if (data.stale) return;
+        setPersonCheck({
+          person,
+          status: data.safe ? 'safe' : 'unsafe',
+          violations: data.violations || []
+        });
+      } catch (error) {
+        if (error.name !== 'AbortError') {
+          console.error('Error checking person:', error);
+          setPersonCheck(null);
+        }
+      }
+    }, 500);
+
+    return () => {
+      clearTimeout(timer);
+      controller.abort();
+    };
+  }, [humanMove.person, gameId, waitingForHuman]);
+
   // Auto-play functionality (but not when waiting for human)
   useEffect(() => {
     if (autoPlay && gameState && !gameState.game_over && !loading && !waitingForHuman) {
@@ -272,6 +317,14 @@ export default function Home() {
                   onChange={(e) => setHumanMove({...humanMove, person: e.target.value})}
                   className="move-input"
                 />
+                {personCheck && (
+                  <div className={`person-check ${personCheck.status}`}>
+                    {personCheck.status === 'checking' && `Checking ${personCheck.person}...`}
+                    {personCheck.status === 'safe' && `✅ ${personCheck.person} looks safe`}
+                    {personCheck.status === 'unsafe' && `⚠️ ${personCheck.person} is banned: ${personCheck.violations.join(', ')}`}
+                    {personCheck.status === 'error' && `Couldn't check ${personCheck.person}`}
+                  </div>
+                )}
                 <input
                   type="text"
                   placeholder="Category (e.g., US Presidents)"
@@ -722,6 +775,21 @@ export default function Home() {
           border-color: #1f2937;
         }
 
+        .person-check {
+          font-size: 0.85rem;
+          text-align: left;
+          margin-top: -8px;
+          color: #6b7280;
+        }
+
+        .person-check.safe {
+          color: #047857;
+        }
+
+        .person-check.unsafe {
+          color: #b91c1c;
+        }
+
         .submit-move-button {
           background: #1f2937;
           color: white;